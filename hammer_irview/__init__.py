@@ -6,27 +6,37 @@ A graphical intermediate representation viewer for chip floorplanning.
 Created by Jasmine Angle - angle@berkeley.edu
 """
 
+import os
 import sys
 import logging
-from hammer_irview.irv import IRVApp
+from typing import TYPE_CHECKING
 
-import matplotlib
-
-from hammer.vlsi import HammerDriver
+# Qt, Matplotlib and Hammer are only imported once IRView is launched, so
+# Verilog parse workers can import this package cheaply.
+if TYPE_CHECKING:
+  from hammer.vlsi import HammerDriver
 
 LOGGER = logging.getLogger(__name__)
 
 
 def invoke_irv(args):
+  import matplotlib
+  from hammer_irview.irv import IRVApp
+
   # Launches Qt event loop
-  logging.basicConfig(encoding='utf-8', level=logging.INFO,
+  # Debug logging formats a message per file and module, so it is opt-in
+  level = logging.DEBUG if os.environ.get('IRV_DEBUG') else logging.INFO
+  logging.basicConfig(encoding='utf-8', level=level,
                       format="[{pathname:>20s}:{lineno:<4}]  {levelname:<7s}   {message}", style='{')
   
   matplotlib.use('Agg')
   app = IRVApp(args)
   sys.exit(app.exec())
 
-def invoke_irv_hammer(driver: HammerDriver, errors):
+def invoke_irv_hammer(driver: 'HammerDriver', errors):
+  import matplotlib
+  from hammer_irview.irv import IRVApp
+
   # Launches everything from a Hammer context.
   #logging.basicConfig(encoding='utf-8', level=logging.INFO,
   #                    format="[{pathname:>20s}:{lineno:<4}]  {levelname:<7s}   {message}", style='{')
@@ -39,7 +49,7 @@ def invoke_irv_hammer(driver: HammerDriver, errors):
 class IRViewDriverMixin:
 
   def run_main_parsed(self, args):
-    print(args)
+    LOGGER.debug('IRView driver arguments: %s', args)
     action = str(args['action'])
     if action == 'irv':
       driver, errors = self.args_to_driver(args)
@@ -1,2 +1,9 @@
-from .app import IRVApp
-from .mainwindow import MainWindow
+def __getattr__(name):
+  # The application imports Qt, so only load it once it's requested.
+  if name == 'IRVApp':
+    from .app import IRVApp
+    return IRVApp
+  if name == 'MainWindow':
+    from .mainwindow import MainWindow
+    return MainWindow
+  raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,16 +1,50 @@
+import logging
 import signal
-from threading import Thread
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtWidgets import QApplication
 
 from hammer.hammer.vlsi.driver import HammerDriver
 from hammer_irview.irv.mainwindow import MainWindow
 
+LOGGER = logging.getLogger(__name__)
+
+
+class HammerLoadSignals(QObject):
+  """
+  Signals emitted by a HammerLoadRunnable. QRunnable is not a QObject, so the
+  signals live on this sidecar object.
+  """
+  finished = Signal()
+  failed = Signal(str)
+
+
+class HammerLoadRunnable(QRunnable):
+  """
+  Loads all Hammer data for the main window on a QThreadPool worker thread.
+  """
+
+  def __init__(self, main: MainWindow, driver: HammerDriver):
+    super().__init__()
+    self.main = main
+    self.driver = driver
+    self.signals = HammerLoadSignals()
+
+  def run(self):
+    try:
+      self.main.load_hammer_data(self.driver)
+    except Exception as e:
+      LOGGER.exception('Failed to load HAMMER data.')
+      self.signals.failed.emit(str(e))
+    else:
+      self.signals.finished.emit()
+
 
 class IRVApp(QApplication):
 
   def __init__(self, driver: HammerDriver):
     super().__init__([])
     self.main = MainWindow()  # 'global'
+    self.loader = None
 
     def handle_sigint(signum, frame):
       driver.log.info("SIGINT received. Exiting gracefully...")
@@ -19,5 +53,9 @@ class IRVApp(QApplication):
     # Load the yaml files provided
     if driver:
       signal.signal(signal.SIGINT, handle_sigint)
-      Thread(target=self.main.load_hammer_data, args=(driver,)).start()
+      self.loader = HammerLoadRunnable(self.main, driver)
+      self.loader.signals.finished.connect(self.main.handle_hammer_data_loaded)
+      self.loader.signals.failed.connect(self.main.handle_hammer_data_failed)
+      self.main.loader_modal.show()
+      QThreadPool.globalInstance().start(self.loader)
       # self.main.load_yamls(args[1:])
@@ -8,6 +8,12 @@ LOGGER = logging.getLogger(__name__)
 
 class IRVMacro:
 
+  KIND = 1
+  """
+  Type tag shared with `VerilogModule.KIND`, see
+  `VerilogModuleHierarchy.parse_module_instances`.
+  """
+
   def __init__(self, lef_macro: _lef.C_Lef_Macro):
     self.macro = lef_macro
     self.geometry_by_layer: dict[str, _lef.C_Lef_Rect] = {}
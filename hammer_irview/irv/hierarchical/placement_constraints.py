@@ -1,13 +1,20 @@
 import enum
+import logging
+import sys
 from typing import *
 from decimal import Decimal
 
+import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import EllipseCollection, PolyCollection
+from matplotlib.colors import to_rgba
 from matplotlib.patches import Circle, Rectangle
 from matplotlib.transforms import Bbox, TransformedBbox
 from pyqtgraph.parametertree import Parameter
 from PySide6.QtCore import SIGNAL
 
+from hammer.hammer.tech.stackup import RoutingDirection
+
 if TYPE_CHECKING:
   from hammer_irview.irv.hierarchical.verilog_module import *
   
@@ -15,6 +22,8 @@ from hammer_irview.irv.pluginmgr import IRVBehavior
 
 from hammer_irview.irv.hierarchical.lef import IRVMacro
 
+LOGGER = logging.getLogger(__name__)
+
 
 class IRVAlignCheck(enum.Enum):
   ALIGNED = 0
@@ -22,6 +31,43 @@ class IRVAlignCheck(enum.Enum):
   MISALIGNED = 2
 
 
+def build_collections(axes: Axes, rects: list, markers: list) -> list:
+  """
+  Batches plain geometry data into Matplotlib collections, adding one artist
+  per geometry kind to the axes instead of one artist per shape.
+
+  Args:
+      axes (Axes): Axes to add the collections to.
+      rects (list): (x, y, width, height, edgecolor, facecolor) tuples.
+      markers (list): (x, y, radius, edgecolor, facecolor) tuples.
+
+  Returns:
+      list: Collection artists added to the axes.
+  """
+  artists = []
+  if rects:
+    x, y, w, h = np.array([rect[:4] for rect in rects], dtype=float).T
+    verts = np.array([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+    collection = PolyCollection(verts.transpose(2, 0, 1),
+                                edgecolors=[rect[4] for rect in rects],
+                                facecolors=[rect[5] for rect in rects])
+    artists.append(collection)
+
+  if markers:
+    offsets = np.array([marker[:2] for marker in markers], dtype=float)
+    diameters = np.array([marker[2] for marker in markers], dtype=float) * 2
+    collection = EllipseCollection(diameters, diameters, 0, units='xy',
+                                   offsets=offsets,
+                                   offset_transform=axes.transData,
+                                   edgecolors=[marker[3] for marker in markers],
+                                   facecolors=[marker[4] for marker in markers])
+    artists.append(collection)
+
+  for artist in artists:
+    axes.add_collection(artist, autolim=False)
+  return artists
+
+
 class ModuleConstraint:
   """
   Modelable placement constraint object.
@@ -29,36 +75,62 @@ class ModuleConstraint:
 
   # pyname = Mapping for class variable.
 
+  __slots__ = ('hierarchy', 'misaligned_layers',
+               'misaligned_log', 'tooltip', 'module', 'path', 'type', 'x', 'y', 'width',
+               'height', 'margins', 'defined', 'yml', 'geometry', 'row_index',
+               'text_artist', '_params', '_rect', '_rect_axes', '__weakref__')
+
+  BASE_PARAMS = (
+    # (Parameter path, type, getter, extra Parameter options)
+    # A getter is either a YAML key (stored as an attribute of the same name)
+    # or the name of a `get_param_*` method. Identifying fields are read-only,
+    # as modules and path lookups are keyed by them.
+    ('Constraint', 'group', None, None),
+    ('Constraint/Path', 'str', 'path', {'readonly': True}),
+    ('Constraint/Type', 'str', 'type', {'readonly': True}),
+    ('Constraint/Position', 'group', None, None),
+    ('Constraint/Position/x', 'float', 'x', None),
+    ('Constraint/Position/y', 'float', 'y', None),
+    ('Constraint/Dimensions', 'group', None, None),
+    ('Constraint/Dimensions/Width', 'float', 'width', None),
+    ('Constraint/Dimensions/Height', 'float', 'height', None),
+    ('Constraint/Dimensions/Layers', 'checklist', 'get_param_layers', None),
+    ('Constraint/Margins', 'group', None, None),
+    ('Constraint/Margins/Left', 'float', 'get_param_margins', None),
+    ('Constraint/Margins/Right', 'float', 'get_param_margins', None),
+    ('Constraint/Margins/Top', 'float', 'get_param_margins', None),
+    ('Constraint/Margins/Bottom', 'float', 'get_param_margins', None),
+  )
+
+  EXTRA_PARAMS = ()
+  """
+  Subclass-specific parameters, shown after the base constraint parameters.
+  """
+
+  ALIGNMENT_ATTRIBUTES = frozenset(('x', 'y', 'width', 'height'))
+  """
+  Attributes checked for grid alignment, which is rechecked when they change.
+  """
+
+  CONSTRAINT_PARAMS = BASE_PARAMS
+
+  def __init_subclass__(cls, **kwargs):
+    super().__init_subclass__(**kwargs)
+    # Merge the parameter template once per class instead of per instance
+    cls.CONSTRAINT_PARAMS = ModuleConstraint.BASE_PARAMS + cls.EXTRA_PARAMS
+
   def __init__(self, yml: dict, hierarchy: 'VerilogModuleHierarchy'):
-    
-    self.add_param_dict(dict(name='Constraint', type='group', child_params=[
-      dict(name='Path', getter='path', type='str'),
-      dict(name='Type', getter='type', type='str'),
-      dict(name='Position', type='group', child_params=[
-        dict(name='x', type='float', getter='x'),
-        dict(name='y', type='float', getter='y'),
-      ]),
-      dict(name='Dimensions', type='group', child_params=[
-        dict(name='Width', type='float', getter='width'),
-        dict(name='Height', type='float', getter='height'),
-        dict(name='Layers', type='checklist', getter=self.get_param_layers, limits=hierarchy.layers.values()),
-      ]),
-      dict(name='Margins', type='group', child_params=[
-        dict(name='Left', type='float', getter=self.get_param_margins),
-        dict(name='Right', type='float', getter=self.get_param_margins),
-        dict(name='Top', type='float', getter=self.get_param_margins),
-        dict(name='Bottom', type='float', getter=self.get_param_margins),
-      ]),
-    ]), end=False)
-    
-    module_name = yml.get('path').split('/', 1)[0]
+    path = yml.get('path') or ''
+    module_name, _, _ = path.partition('/')
     self.hierarchy = hierarchy
 
     self.misaligned_layers = None
     self.misaligned_log = 'Alignment was not checked for this constraint.'
+    # Rendered alignment tooltip, reset whenever the alignment is rechecked
+    self.tooltip = None
 
     self.module = hierarchy.get_module_by_name(module_name)
-    self.path = yml.get('path')
+    self.path = path
     self.type = yml.get('type')
     self.x = yml.get('x', 0)
     self.y = yml.get('y', 0)
@@ -68,33 +140,79 @@ class ModuleConstraint:
     self.defined = True
     self.yml = yml
     self.geometry = []
+    self.row_index = 0
     self.text_artist = None
+    self._rect = None
+    self._rect_axes = None
+
+    # Plain attributes are read now, the parameter tree only when first shown.
+    self._params = None
+    for _, _, getter, _ in self.CONSTRAINT_PARAMS:
+      if getter and not callable(getattr(type(self), getter, None)):
+        value = yml.get(getter) or 0
+        if isinstance(value, str):
+          # Types and master names repeat across many constraints
+          value = sys.intern(value)
+        setattr(self, getter, value)
 
-    self.params = Parameter.create(name='root', type='group')
-    remaining = [(p, self.params) for p in self.constraint_params]
-    while remaining:
-      param_dict, parent = remaining.pop(0)
-      param = Parameter.create(**param_dict)
-      
-      if param_dict['type'] == 'group':
-        for child in param_dict['child_params']:
-          remaining.append((child, param))
-        del param_dict['child_params']
-
-      if 'getter' in param_dict:
-        getter = param_dict['getter']
-        value = ''
-        if isinstance(getter, str):
-          value = yml.get(getter) or 0
-          setattr(self, getter, value)
-        elif callable(getter):
-          value = getter(yml, param_dict['name'])
-        
-        param.setDefault(value)
-        param.setToDefault()
-        
-      param.sigStateChanged.connect(self.param_state_changed)
-      parent.addChild(param)
+  @property
+  def params(self) -> Parameter:
+    """
+    Parameter tree of this constraint. Most constraints are never selected,
+    so it is only built on first access.
+    """
+    if self._params is None:
+      self.build_params()
+    return self._params
+
+  def build_params(self):
+    """
+    Builds the constraint's parameter tree from `CONSTRAINT_PARAMS`. The
+    nested option dicts are assembled first so the whole tree is created by a
+    single `Parameter.create` call.
+    """
+    yml = self.yml
+    children = []
+    groups = {'': children}
+    for path, param_type, getter, options in self.CONSTRAINT_PARAMS:
+      parent_path, _, name = path.rpartition('/')
+      param_opts = dict(options or {}, name=name, type=param_type)
+
+      if param_type == 'checklist':
+        # Checklists select from the technology's metal layers.
+        param_opts['limits'] = self.hierarchy.layers.values()
+
+      if getter:
+        value = self.get_param_value(yml, getter, name)
+        param_opts['value'] = value
+        param_opts['default'] = value
+        if not callable(getattr(type(self), getter, None)) \
+            and not param_opts.get('readonly'):
+          # Plain attributes follow edits made in the parameter tree
+          param_opts['attribute'] = getter
+
+      if param_type == 'group':
+        param_opts['children'] = groups[path] = []
+      groups[parent_path].append(param_opts)
+
+    self._params = Parameter.create(name='root', type='group',
+                                    children=children)
+    self._params.sigTreeStateChanged.connect(self.param_state_changed)
+
+  def get_param_value(self, yml: dict, getter: str, name: str):
+    """
+    Resolves the value of a parameter from its getter.
+
+    Args:
+        yml (dict): Serialized placement constraint.
+        getter (str): YAML key or `get_param_*` method name.
+        name (str): Name of the parameter.
+    """
+    method = getattr(type(self), getter, None)
+    if callable(method):
+      return method(self, yml, name)
+    # Plain attributes were read in `__init__` and may since have been edited
+    return getattr(self, getter)
 
   def rotate_coordinates(self, origin: Tuple[Decimal, Decimal], size: Tuple[Decimal, Decimal], orientation: str) -> Tuple[Decimal, Decimal]:
     x,y = origin
@@ -120,21 +238,37 @@ class ModuleConstraint:
       return (x,y)
 
   def refresh_alignment(self):
+    layers = list(self.hierarchy.layers.values())
+    aligned = []
+    if layers:
+      # Convert the bounding box once instead of once per layer
+      ratios = layers[0].get_alignment_ratios(
+        self.x, self.y, self.width, self.height)
+      aligned = [layer.check_alignment_ratios(ratios) for layer in layers]
+    self.set_alignment(layers, aligned)
+
+  def set_alignment(self, layers: list, aligned: list):
+    """
+    Records the results of a grid alignment check.
+
+    Args:
+        layers (list[TechMetalLayer]): Checked metal layers.
+        aligned (list[bool]): Whether the constraint is aligned to each layer.
+    """
     cmul_log = []
     self.misaligned_layers = []
     
     self.hierarchy.driver.log.info(f'--- Refreshing alignment check for module constraint "{self.path}" (Parent Module: "{self.module.name}") ---')
-    for layer in self.hierarchy.layers.values():
-      aligned = layer.check_alignment(self.x, self.y, self.width, self.height)
-
-      align_log = f'Metal {layer.name} ({layer.dir}, grid unit: {layer.metal.grid_unit}): Alignment {"PASS" if aligned else "FAIL"} x: {self.x}, y: {self.y}, width: {self.width}, height: {self.height}'
+    for layer, layer_aligned in zip(layers, aligned):
+      align_log = f'Metal {layer.name} ({layer.dir}, grid unit: {layer.metal.grid_unit}): Alignment {"PASS" if layer_aligned else "FAIL"} x: {self.x}, y: {self.y}, width: {self.width}, height: {self.height}'
       cmul_log.append(align_log)
       self.hierarchy.driver.log.info('\t' + align_log)
 
-      if not aligned:
+      if not layer_aligned:
         self.misaligned_layers.append(layer)
         
     self.misaligned_log = '\n'.join(cmul_log)
+    self.tooltip = None
 
   @property
   def is_grid_aligned(self) -> IRVAlignCheck:
@@ -163,17 +297,60 @@ class ModuleConstraint:
     layer_strs = yml.get('layers', [])
     return [self.hierarchy.layers[layer_str] for layer_str in layer_strs]
   
-  def add_param_dict(self, param_dict, end=True):
-    if hasattr(self, 'constraint_params') and end:
-      self.constraint_params.append(param_dict)
-    elif hasattr(self, 'constraint_params') and not end:
-      self.constraint_params.insert(0, param_dict)
-    else:
-      self.constraint_params = [param_dict]
-    
-  def param_state_changed(self, param, change, info):
-    pass
-    #print('state changed')
+  def param_state_changed(self, param, changes):
+    value_changed = False
+    alignment_changed = False
+    for changed_param, change, data in changes:
+      # Options, limits and children changes don't affect the geometry
+      if change != 'value':
+        continue
+      value_changed = True
+      attribute = changed_param.opts.get('attribute')
+      if attribute:
+        setattr(self, attribute, data)
+        alignment_changed |= attribute in self.ALIGNMENT_ATTRIBUTES
+    if alignment_changed:
+      self.refresh_alignment()
+    if value_changed:
+      self.hierarchy.invalidate_geometry()
+
+  def render_incremental(self, axes: Axes) -> list:
+    """
+    Updates this constraint's own rectangle and label in place after an edit,
+    so the canvas can blit them without re-rendering the whole module.
+    Constraints without a rectangle on these axes return no artists, which
+    signals that a full render is needed instead.
+
+    Args:
+        axes (Axes): Axes the constraint was rendered onto.
+
+    Returns:
+        list: Updated artists to redraw.
+    """
+    rect = self._rect
+    if rect is None or self._rect_axes is not axes or rect.axes is None:
+      return []
+    if not (self.width and self.height):
+      return []
+    # Constraints are rendered relative to the module origin on their canvas
+    rect.set_bounds(self.x, self.y, self.width, self.height)
+    if self.text_artist is None or self.text_artist.axes is not axes:
+      return [rect]
+    self.update_text_artist(axes, rect)
+    return [rect, self.text_artist]
+
+  def get_bounds(self) -> tuple | None:
+    """
+    Returns the area covered by this constraint on its module's canvas, which
+    is used to resolve clicks.
+
+    Returns:
+        tuple | None: (x min, y min, x max, y max), or None if the constraint
+          covers no area.
+    """
+    if not (self.width and self.height):
+      return None
+    return (self.x, self.y, self.x + self.width, self.y + self.height)
 
   def populate_params(self, tree):
     tree.setParameters(self.params, False)
@@ -184,6 +361,56 @@ class ModuleConstraint:
     Renders the constraint onto the provided Matplotlib axes object.
     """
     return []
+
+  def place_rect(self, axes: Axes, coords: tuple[int, int], width, height,
+                 edgecolor, facecolor) -> Rectangle:
+    """
+    Places this constraint's Rectangle artist onto the axes. The artist is
+    created once per axes; re-renders only update its bounds and colors.
+
+    Args:
+        axes (Axes): Axes to draw onto.
+        coords (tuple[int, int]): Lower-left corner of the rectangle.
+        width: Width of the rectangle.
+        height: Height of the rectangle.
+        edgecolor: Border color, preferably pre-resolved RGBA.
+        facecolor: Fill color, preferably pre-resolved RGBA.
+
+    Returns:
+        Rectangle: The placed rectangle.
+    """
+    rect = self._rect
+    if rect is None or self._rect_axes is not axes:
+      rect = Rectangle(coords, width, height,
+                       edgecolor=edgecolor, facecolor=facecolor)
+      self._rect = rect
+      self._rect_axes = axes
+    else:
+      rect.set_bounds(*coords, width, height)
+      rect.set_edgecolor(edgecolor)
+      rect.set_facecolor(facecolor)
+
+    # Removed artists (i.e., after a canvas re-render) need to be re-added.
+    if rect.axes is None:
+      axes.add_artist(rect)
+    return rect
+
+  def collect_geometry(self, relative_offset: tuple[int, int],
+                       under_hierarchy: bool, render_hierarchy: bool,
+                       rects: list, markers: list):
+    """
+    Appends the constraint's geometry as plain data so that a parent
+    hierarchical constraint can batch it into Matplotlib collections.
+
+    Args:
+        relative_offset (tuple[int, int]): Origin of the parent constraint.
+        under_hierarchy (bool): Whether this is drawn under a hierarchical
+          constraint.
+        render_hierarchy (bool): Whether nested hierarchies are expanded.
+        rects (list): Receives (x, y, width, height, edgecolor, facecolor).
+        markers (list): Receives (x, y, radius, edgecolor, facecolor).
+    """
+    pass
   
   def get_display_text(self):
     return self.path
@@ -205,6 +432,9 @@ class ModuleConstraint:
     if not self.text_artist:
       self.text_artist = axes.annotate(txt, (rxt, cy), 
         color='black', fontsize=6, ha='right', va='bottom') # weight='bold'
+    else:
+      # Follow the constraint when it is moved or resized
+      self.text_artist.xy = self.text_artist.xyann = (rxt, cy)
 
     bbox = TransformedBbox(Bbox([[rx,ry],[rxt,ryt]]), axes.transData)
     self.text_artist.set_clip_box(bbox)
@@ -217,6 +447,23 @@ class ModuleConstraint:
     # self.text_artist.set_size(self.text_artist.get_size() * scale)
 
   
+  def release_artists(self, axes: Axes):
+    """
+    Drops the artists this constraint keeps for the provided axes, so that a
+    closed canvas can be freed. They are created anew on the next render.
+
+    Args:
+        axes (Axes): Axes of the canvas being closed.
+    """
+    if self._rect_axes is axes:
+      self._rect = None
+      self._rect_axes = None
+    # Not all geometry goes through `place_rect` (i.e., hard macros)
+    if any(artist.axes is axes for artist in self.geometry):
+      self.geometry = []
+    if self.text_artist is not None and self.text_artist.axes is axes:
+      self.text_artist = None
+
   def draw_resize(self, axes: Axes):
     if self.geometry:
       shape = self.geometry[0]
@@ -256,6 +503,13 @@ class ModuleTopLevel(ModuleConstraint):
   HIER_COLOR_BORDER = 'lightcoral'
   HIER_COLOR_FILL = 'mistyrose'
 
+  TOP_RGBA_BORDER = to_rgba(TOP_COLOR_BORDER)
+  TOP_RGBA_FILL = to_rgba(TOP_COLOR_FILL)
+  HIER_RGBA_BORDER = to_rgba(HIER_COLOR_BORDER)
+  HIER_RGBA_FILL = to_rgba(HIER_COLOR_FILL)
+
+  __slots__ = ()
+
   def __init__(self, yml, hierarchy):
     super().__init__(yml, hierarchy)
 
@@ -267,19 +521,22 @@ class ModuleTopLevel(ModuleConstraint):
     coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
 
     if under_hierarchy:
-      self.geometry = [Rectangle(coords, self.width, self.height,
-                                edgecolor=self.HIER_COLOR_BORDER,
-                                facecolor=self.HIER_COLOR_FILL)]
+      colors = (self.HIER_RGBA_BORDER, self.HIER_RGBA_FILL)
     else:
-      self.geometry = [Rectangle(coords, self.width, self.height,
-                                edgecolor=self.TOP_COLOR_BORDER,
-                                facecolor=self.TOP_COLOR_FILL)]
-    
-    for geom in self.geometry:
-      geom.set_picker(True)
-      axes.add_artist(geom)
+      colors = (self.TOP_RGBA_BORDER, self.TOP_RGBA_FILL)
+    self.geometry = [self.place_rect(axes, coords, self.width, self.height,
+                                     *colors)]
     return self.geometry
 
+  def collect_geometry(self, relative_offset, under_hierarchy,
+                       render_hierarchy, rects, markers):
+    if under_hierarchy:
+      colors = (self.HIER_RGBA_BORDER, self.HIER_RGBA_FILL)
+    else:
+      colors = (self.TOP_RGBA_BORDER, self.TOP_RGBA_FILL)
+    rects.append((relative_offset[0] + self.x, relative_offset[1] + self.y,
+                  self.width, self.height, *colors))
+
 
 class ModuleHierarchical(ModuleConstraint):
   """
@@ -294,18 +551,28 @@ class ModuleHierarchical(ModuleConstraint):
   HIER_COLOR_BORDER = 'lightcoral'
   HIER_COLOR_FILL = 'mistyrose'
 
+  TOP_RGBA_BORDER = to_rgba(TOP_COLOR_BORDER)
+  TOP_RGBA_FILL = to_rgba(TOP_COLOR_FILL)
+  HIER_RGBA_BORDER = to_rgba(HIER_COLOR_BORDER)
+  HIER_RGBA_FILL = to_rgba(HIER_COLOR_FILL)
+
+  EXTRA_PARAMS = (
+    ('Hierarchical', 'group', None, None),
+    ('Hierarchical/Master', 'str', 'master', {'readonly': True}),
+  )
+
+  __slots__ = ('master', 'master_module', '_child_geometry')
+
   def __init__(self, yml, hierarchy):
-    constraint_params = dict(name='Hierarchical', type='group', child_params=[
-      dict(name='Master', getter='master', type='str'),
-    ])
-    self.add_param_dict(constraint_params)
     super().__init__(yml, hierarchy)
 
     self.defined = False
 
     # Get the reference to the master module that this constraint depends on
     self.master_module = hierarchy.get_module_by_name(self.master)
-    
+
+    # Flattened child geometry of the form: (key, rects, markers)
+    self._child_geometry = (None, None, None)
 
 
   def render(self, axes: Axes, relative_offset: tuple[int, int],
@@ -313,28 +580,56 @@ class ModuleHierarchical(ModuleConstraint):
     coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
 
     if not under_hierarchy:
-      self.geometry = [Rectangle(coords, self.width, self.height,
-                                edgecolor=self.HIER_COLOR_BORDER,
-                                facecolor=self.HIER_COLOR_FILL)]
+      colors = (self.HIER_RGBA_BORDER, self.HIER_RGBA_FILL)
     else:
-      self.geometry = [Rectangle(coords, self.width, self.height,
-                                edgecolor=self.TOP_COLOR_BORDER,
-                                facecolor=self.TOP_COLOR_FILL)]
-    
-    for geom in self.geometry:
-      geom.set_picker(True)
-      axes.add_artist(geom)
-    all_artists = self.geometry
+      colors = (self.TOP_RGBA_BORDER, self.TOP_RGBA_FILL)
+    self.geometry = [self.place_rect(axes, coords, self.width, self.height,
+                                     *colors)]
+    all_artists = list(self.geometry)
 
-    if render_hierarchy:
-      for constraint in self.master_module.placement_constraints.values():
-        subartists = constraint.render(axes, coords,
-                                       under_hierarchy=True,
-                                       render_hierarchy=render_hierarchy)
-        all_artists.extend(subartists)
+    if render_hierarchy and self.master_module:
+      # Batch the whole nested hierarchy into a handful of collections.
+      rects, markers = self.get_child_geometry(coords)
+      all_artists.extend(build_collections(axes, rects, markers))
 
     return all_artists
 
+  def get_child_geometry(self, coords: tuple[int, int]) -> tuple[list, list]:
+    """
+    Returns the flattened geometry of the master module's constraints, placed
+    at the provided origin. The result is reused until the origin or the
+    hierarchy's geometry version changes.
+
+    Args:
+        coords (tuple[int, int]): Origin of this constraint.
+
+    Returns:
+        tuple[list, list]: Rectangle and marker tuples, see `collect_geometry`.
+    """
+    key = (self.hierarchy.geometry_version, coords)
+    cached_key, rects, markers = self._child_geometry
+    if cached_key != key:
+      rects = []
+      markers = []
+      for constraint in self.master_module.constraints.values():
+        constraint.collect_geometry(coords, True, True, rects, markers)
+      self._child_geometry = (key, rects, markers)
+    return rects, markers
+
+  def collect_geometry(self, relative_offset, under_hierarchy,
+                       render_hierarchy, rects, markers):
+    coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
+    if not under_hierarchy:
+      colors = (self.HIER_RGBA_BORDER, self.HIER_RGBA_FILL)
+    else:
+      colors = (self.TOP_RGBA_BORDER, self.TOP_RGBA_FILL)
+    rects.append((*coords, self.width, self.height, *colors))
+
+    if render_hierarchy and self.master_module:
+      child_rects, child_markers = self.get_child_geometry(coords)
+      rects.extend(child_rects)
+      markers.extend(child_markers)
+
 class ModuleObstruction(ModuleConstraint):
   """
   Parses the submodule bbox yaml element into a modelable constraint object.
@@ -344,20 +639,24 @@ class ModuleObstruction(ModuleConstraint):
   """
   COLOR_BORDER = 'darkseagreen'
   COLOR_FILL = 'honeydew'
+  RGBA_BORDER = to_rgba(COLOR_BORDER)
+  RGBA_FILL = to_rgba(COLOR_FILL)
+
+  __slots__ = ()
 
   def render(self, axes: Axes, relative_offset: tuple[int, int],
              under_hierarchy: bool, render_hierarchy: bool):
     coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
 
-    self.geometry = [Rectangle(coords, self.width, self.height,
-                              edgecolor=self.COLOR_BORDER,
-                              facecolor=self.COLOR_FILL)]
-    
-    for geom in self.geometry:
-      geom.set_picker(True)
-      axes.add_artist(geom)
+    self.geometry = [self.place_rect(axes, coords, self.width, self.height,
+                                     self.RGBA_BORDER, self.RGBA_FILL)]
     return self.geometry
 
+  def collect_geometry(self, relative_offset, under_hierarchy,
+                       render_hierarchy, rects, markers):
+    rects.append((relative_offset[0] + self.x, relative_offset[1] + self.y,
+                  self.width, self.height, self.RGBA_BORDER, self.RGBA_FILL))
+
 class ModuleOverlap(ModuleConstraint):
   """
   Parses the submodule bbox yaml element into a modelable constraint object.
@@ -367,32 +666,46 @@ class ModuleOverlap(ModuleConstraint):
   """
   COLOR_BORDER = 'lightskyblue'
   COLOR_FILL = 'aliceblue'
+  RGBA_BORDER = to_rgba(COLOR_BORDER)
+  RGBA_FILL = to_rgba(COLOR_FILL)
+
+  __slots__ = ()
 
   def render(self, axes: Axes, relative_offset: tuple[int, int],
              under_hierarchy: bool, render_hierarchy: bool):
     coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
 
-    self.geometry = [Rectangle(coords, self.width, self.height,
-                              edgecolor=self.COLOR_BORDER,
-                              facecolor=self.COLOR_FILL)]
-    
-    for geom in self.geometry:
-      geom.set_picker(True)
-      axes.add_artist(geom)
+    self.geometry = [self.place_rect(axes, coords, self.width, self.height,
+                                     self.RGBA_BORDER, self.RGBA_FILL)]
     return self.geometry
 
+  def collect_geometry(self, relative_offset, under_hierarchy,
+                       render_hierarchy, rects, markers):
+    rects.append((relative_offset[0] + self.x, relative_offset[1] + self.y,
+                  self.width, self.height, self.RGBA_BORDER, self.RGBA_FILL))
+
 class ModuleHardMacro(ModuleConstraint):
   """
   Parses the hardmacro bbox yaml element into a modelable constraint object.
   """
   COLOR_BORDER = 'rebeccapurple'
   COLOR_FILL = 'mediumpurple'
+  RGBA_BORDER = to_rgba(COLOR_BORDER)
+  RGBA_FILL = to_rgba(COLOR_FILL)
+
+  MARKER_RADIUS = 3
+  """
+  Radius of the marker drawn at the macro's origin.
+  """
+
+  EXTRA_PARAMS = (
+    ('Macro', 'group', None, None),
+    ('Macro/LEF File', 'str', 'path', {'readonly': True}),
+  )
+
+  __slots__ = ('master_module', '_macro_size')
 
   def __init__(self, yml, hierarchy):
-    constraint_params = dict(name='Macro', type='group', child_params=[
-      dict(name='LEF File', getter='path', type='str'),
-    ])
-    self.add_param_dict(constraint_params)
     super().__init__(yml, hierarchy)
 
     self.defined = False
@@ -402,12 +715,18 @@ class ModuleHardMacro(ModuleConstraint):
     if isinstance(self.master_module, str):
       self.master_module = hierarchy.macro_library.get_macro(self.master_module)
 
+    # LEF sizes are fixed once bound, so resolve them once for redraws
+    self._macro_size = None
+    if isinstance(self.master_module, IRVMacro):
+      self._macro_size = (self.master_module.macro.c_size_x,
+                          self.master_module.macro.c_size_y)
+
     if not self.master_module:
-      print(f'Hard Macro placement constraint for {self.path} is not associated with a defined Verilog instance!')
-    else:
-      self.width = self.master_module.macro.c_size_x
-      self.height = self.master_module.macro.c_size_y
-    print('Placement Constraint Master: ', self.master_module)
+      LOGGER.warning('Hard Macro placement constraint for %s is not '
+                     'associated with a defined Verilog instance!', self.path)
+    elif self._macro_size:
+      self.width, self.height = self._macro_size
+    LOGGER.debug('Placement Constraint Master: %s', self.master_module)
 
   def render(self, axes: Axes, relative_offset: tuple[int, int],
              under_hierarchy: bool, render_hierarchy: bool):
@@ -420,9 +739,8 @@ class ModuleHardMacro(ModuleConstraint):
       width = self.width
       height = self.height
 
-    if isinstance(self.master_module, IRVMacro):
-      width = self.master_module.macro.c_size_x
-      height = self.master_module.macro.c_size_y
+    if self._macro_size:
+      width, height = self._macro_size
 
     if width and height:
       self.geometry.append(Rectangle(coords, width, height,
@@ -430,15 +748,38 @@ class ModuleHardMacro(ModuleConstraint):
                                 facecolor=self.COLOR_FILL))
 
     # Propagate via LEF
-    self.geometry.append(Circle(coords, 3,
+    self.geometry.append(Circle(coords, self.MARKER_RADIUS,
                               edgecolor=self.COLOR_BORDER,
                               facecolor=self.COLOR_FILL))
       
     for geom in self.geometry:
-      geom.set_picker(True)
       axes.add_artist(geom)
     return self.geometry
 
+  def get_bounds(self):
+    radius = self.MARKER_RADIUS
+    x_min, y_min = self.x - radius, self.y - radius
+    x_max, y_max = self.x + radius, self.y + radius
+    width, height = self._macro_size or (self.width, self.height)
+    if width and height:
+      x_max = max(x_max, self.x + width)
+      y_max = max(y_max, self.y + height)
+    return (x_min, y_min, x_max, y_max)
+
+  def collect_geometry(self, relative_offset, under_hierarchy,
+                       render_hierarchy, rects, markers):
+    coords = (relative_offset[0] + self.x, relative_offset[1] + self.y)
+    width = self.width
+    height = self.height
+    if self._macro_size:
+      width, height = self._macro_size
+
+    if width and height:
+      rects.append((*coords, width, height,
+                    self.RGBA_BORDER, self.RGBA_FILL))
+    markers.append((*coords, self.MARKER_RADIUS,
+                    self.RGBA_BORDER, self.RGBA_FILL))
+
 
 class PlacementConstraintManager:
 
@@ -454,6 +795,59 @@ class PlacementConstraintManager:
   def register_placement_constraint_type(name, cls):
     PlacementConstraintManager.PLACEMENT_CONSTRAINT_TYPES[name] = cls
 
+  ALIGNMENT_INT_LIMIT = 1 << 62
+  """
+  Bound on int64 cross products in batched alignment checks; larger
+  operands fall back to the exact per-constraint check.
+  """
+
+  @staticmethod
+  def refresh_alignments(constraints: list[ModuleConstraint]):
+    """
+    Refreshes the grid alignment of many constraints at once. Every
+    constraint edge is checked against every layer's grid in one vectorized
+    pass, rather than in a Python loop per constraint and layer.
+
+    Args:
+        constraints (list[ModuleConstraint]): Constraints to check.
+    """
+    if not constraints:
+      return
+    layers = list(constraints[0].hierarchy.layers.values())
+    if not layers:
+      for constraint in constraints:
+        constraint.set_alignment(layers, [])
+      return
+
+    try:
+      # (constraint, edge, numerator/denominator); edges are x, y, xmax, ymax
+      ratios = np.array([layers[0].get_alignment_ratios(
+        c.x, c.y, c.width, c.height) for c in constraints], dtype=np.int64)
+      grids = np.array([layer.grid_ratio for layer in layers], dtype=np.int64)
+    except OverflowError:
+      ratios = None
+    limit = PlacementConstraintManager.ALIGNMENT_INT_LIMIT
+    if ratios is None \
+        or int(np.abs(ratios).max()) * int(np.abs(grids).max()) >= limit:
+      for constraint in constraints:
+        constraint.refresh_alignment()
+      return
+
+    # edge / grid is integral iff (num * grid_den) % (den * grid_num) == 0
+    nums = ratios[:, :, 0, np.newaxis]
+    dens = ratios[:, :, 1, np.newaxis]
+    on_grid = (nums * grids[:, 1]) % (dens * grids[:, 0]) == 0
+
+    horizontal = np.array([layer.dir == RoutingDirection.Horizontal
+                           for layer in layers])
+    vertical = np.array([layer.dir == RoutingDirection.Vertical
+                         for layer in layers])
+    aligned = np.where(horizontal, on_grid[:, 0] & on_grid[:, 2],
+                       vertical & on_grid[:, 1] & on_grid[:, 3])
+
+    for constraint, constraint_aligned in zip(constraints, aligned.tolist()):
+      constraint.set_alignment(layers, constraint_aligned)
+
   @staticmethod
   def deserialize(yml: dict, hierarchy: 'VerilogModuleHierarchy'
                   ) -> ModuleConstraint:
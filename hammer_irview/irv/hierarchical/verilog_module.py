@@ -1,42 +1,86 @@
 """
 Contains all Verilog-adjacent information modeling classes.
 """
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
+import json
 import logging
+import multiprocessing
+import os
 from pathlib import Path
-import re
+import sys
 import typing
 
-from PySide6 import QtCore, QtWidgets, QtGui
+from PySide6 import QtCore, QtGui
 
 from hammer.hammer.tech.stackup import Metal, RoutingDirection, Stackup
 from hammer.hammer.vlsi.driver import HammerDriver
 from hammer_irview.irv.hierarchical.lef import IRVMacro, MacroLibrary
+from hammer_irview.irv.hierarchical.verilog_parser import VerilogParser
 from hammer_irview.irv.hierarchical.placement_constraints import IRVAlignCheck, ModuleConstraint, ModuleHierarchical, ModuleTopLevel, PlacementConstraintManager
 from hammer_irview.irv.models.verilog_module import VerilogModuleConstraintsModel
+from hammer_irview.irv.widgets.statusbar_mgr import StatusBarLogger
 
 LOGGER = logging.getLogger(__name__)
 
 
 class TechMetalLayer:
 
+  __slots__ = ('metal', 'dir', 'name', 'grid_ratio')
+
   def __init__(self, metal: Metal):
     self.metal = metal
     self.dir = metal.direction
     self.name = metal.name
-  
-  def check_alignment(self, x: Decimal, y: Decimal, width: Decimal, height: Decimal):
+
+    # Grid unit as an exact (numerator, denominator) pair, so alignment checks
+    # reduce to integer modulos.
+    self.grid_ratio = Decimal(str(metal.grid_unit)).as_integer_ratio()
+
+  @staticmethod
+  def get_alignment_ratios(x, y, width, height) -> tuple[tuple[int, int], ...]:
+    """
+    Converts a bounding box into exact integer ratios of the edges that are
+    checked for alignment. Values are read through their decimal string
+    representation, as they were written in the constraints.
+
+    Args:
+        x: Lower-left x coordinate.
+        y: Lower-left y coordinate.
+        width: Width of the bounding box.
+        height: Height of the bounding box.
+
+    Returns:
+        tuple[tuple[int, int], ...]: (x, y, x max, y max) as
+          (numerator, denominator) pairs.
+    """
     x = Decimal(str(x))
     y = Decimal(str(y))
-    width = Decimal(str(width))
-    height = Decimal(str(height))
-    bb_xmax = x + width
-    bb_ymax = y + height
+    bb_xmax = x + Decimal(str(width))
+    bb_ymax = y + Decimal(str(height))
+    return (x.as_integer_ratio(), y.as_integer_ratio(),
+            bb_xmax.as_integer_ratio(), bb_ymax.as_integer_ratio())
+
+  def is_on_grid(self, ratio: tuple[int, int]) -> bool:
+    num, den = ratio
+    grid_num, grid_den = self.grid_ratio
+    return (num * grid_den) % (den * grid_num) == 0
+
+  def check_alignment_ratios(self, ratios: tuple[tuple[int, int], ...]):
+    """
+    Checks pre-converted bounding box edges (see `get_alignment_ratios`)
+    against this layer's grid.
+    """
+    x, y, bb_xmax, bb_ymax = ratios
     if self.dir == RoutingDirection.Horizontal:
-      return x % self.metal.grid_unit == 0.0 and bb_xmax % self.metal.grid_unit == 0.0
+      return self.is_on_grid(x) and self.is_on_grid(bb_xmax)
     elif self.dir == RoutingDirection.Vertical:
-      return y % self.metal.grid_unit == 0.0 and bb_ymax % self.metal.grid_unit == 0.0
+      return self.is_on_grid(y) and self.is_on_grid(bb_ymax)
+
+  def check_alignment(self, x: Decimal, y: Decimal, width: Decimal, height: Decimal):
+    return self.check_alignment_ratios(
+      self.get_alignment_ratios(x, y, width, height))
 
   @staticmethod
   def create_from_stackups(stackups: list[Stackup]):
@@ -57,29 +101,76 @@ class VerilogModule:
   the actual instantiation of this module.
   """
 
-  def __init__(self, name: str, file: Path):
-    self.name = name
+  __slots__ = ('name', 'file', 'hierarchy', '_instances', '_instantiations',
+               'top_constraint', 'children', 'children_count', 'constraints',
+               'constraints_list', '_view_model')
+
+  KIND = 0
+  """
+  Type tag shared with `IRVMacro.KIND`, letting instance resolution dispatch
+  on an integer instead of chained `isinstance` checks.
+  """
+
+  def __init__(self, name: str, file: Path,
+               hierarchy: 'VerilogModuleHierarchy | None' = None,
+               instantiations: list[tuple[str, str]] | None = None):
+    self.name = sys.intern(name)
     self.file = file
-    self.instances = {}
+    self.hierarchy = hierarchy
+    self._instances = {}
+
+    # (module name, instance name) pairs that have not been resolved yet
+    self._instantiations = instantiations if hierarchy else None
 
     self.top_constraint = None
     self.children = []
+    self.children_count = 0
 
-    self.constraints = OrderedDict()
+    self.constraints = {}
     self.constraints_list = []
-    self.constraints_indices = {}
 
-    self.view_model = VerilogModuleConstraintsModel(self)
+    self._view_model = None
+
+  @property
+  def view_model(self) -> VerilogModuleConstraintsModel:
+    """
+    Constraints model backing this module's views. It is only created once a
+    module is first displayed, which also keeps the Qt object on the GUI
+    thread instead of the loader thread.
+    """
+    if self._view_model is None:
+      self._view_model = VerilogModuleConstraintsModel(self)
+    return self._view_model
+
+  @property
+  def instances(self) -> dict:
+    """
+    Instances within this module, of the form {name: VerilogModuleInstance}.
+    Instantiations are only resolved on first access, so modules that are
+    never visited cost nothing beyond their definition.
+    """
+    self.resolve_instances()
+    return self._instances
+
+  def resolve_instances(self):
+    """
+    Resolves this module's instantiations into instances, unless that already
+    happened.
+    """
+    if self._instantiations is not None:
+      instantiations, self._instantiations = self._instantiations, None
+      self.hierarchy.parse_module_instances((self, instantiations))
 
   def add_constraint(self, constraint: ModuleConstraint):
     constraint.module = self
     self.constraints[constraint.path] = constraint
-    self.constraints_indices[constraint] = len(self.constraints_list)
+    constraint.row_index = len(self.constraints_list)
     self.constraints_list.append(constraint)
     if isinstance(constraint, ModuleTopLevel):
       self.top_constraint = constraint
     if isinstance(constraint, ModuleHierarchical):
       self.children.append(constraint)
+      self.children_count += 1
 
   def __str__(self):
     return f'<{self.name} from {self.file}>'
@@ -93,9 +184,13 @@ class VerilogModuleInstance:
   Contains details regarding a specific VerilogModule instance.
   """
 
-  def __init__(self, name: str, module: VerilogModule):
-    self.name = name
-    self.module = module
+  __slots__ = ('name', 'module', 'module_name')
+
+  def __init__(self, name: str, module_name: str):
+    self.name = sys.intern(name)
+    # Name of the instantiated module, kept even once `module` is resolved
+    self.module_name = sys.intern(module_name)
+    self.module = self.module_name
 
 
 class VerilogModuleHierarchy:
@@ -103,24 +198,45 @@ class VerilogModuleHierarchy:
   
   """
 
-  RE_MODULE_DEFINITION = r'module\s+(\w+)\s*(#\s*\([^)]*\)\s*)?\s*\([^)]*\)\s*;([\s\S]*?)endmodule'
+  VERILOG_EXTENSIONS = ('.v', '.sv')
+
+  PARSE_CACHE_FILENAME = '.irv_verilog_cache.json'
+  """
+  Name of the on-disk parse cache written into scanned source directories.
+  The cache is plain JSON, as it is read from directories that may hold
+  third-party sources.
+  """
+
+  PARSE_CACHE_VERSION = 5
+  """
+  Format version of the on-disk parse cache. Bump whenever the parser's
+  output changes so caches written by older versions are discarded.
+  """
+
+  KIND_MODULE = VerilogModule.KIND
+  """
+  Type tag of instances resolved to a VerilogModule.
+  """
+
+  KIND_MACRO = IRVMacro.KIND
   """
-  Pattern to find a Verilog module definition within a file.
+  Type tag of instances resolved to an IRVMacro.
   """
 
-  RE_MODULE_INSTANTIATION = r'(\w+)\s+(\w+)\s*\('
+  KIND_UNRESOLVED = 2
   """
-  Pattern to find Verilog module instantiations within a module's body.
+  Type tag of instances whose module is still an unresolved name.
   """
 
-  RE_BLOCK_COMMENT = r'/\*.*?\*/'
+  PARALLEL_PARSE_MIN_BYTES = 16 << 20
   """
-  Pattern to find a Verilog block comment.
+  Minimum total size of uncached files before parsing is spread over a
+  process pool. Below this, spawning workers costs more than it saves.
   """
 
-  RE_LINE_COMMENT = r'//.*'
+  PARALLEL_PARSE_CHUNK_SIZE = 16
   """
-  Pattern to find a Verilog single-line comment.
+  Number of files sent to a parse worker at a time.
   """
 
 
@@ -128,39 +244,102 @@ class VerilogModuleHierarchy:
 
     # Modules of the form: {name: VerilogModule, ...}
     self.driver = None
-    self.modules = OrderedDict()
+    self.modules = {}
     self.macro_library = MacroLibrary()
-    self.scoped_hierarchy = OrderedDict()
+    self.scoped_hierarchy = {}
     self.top_level = None
+    # Unresolved instances, keyed by the name of the module they instantiate
     self.unknown_macros = defaultdict(set)
 
+    # Bumped whenever constraint geometry changes, invalidating cached renders.
+    self.geometry_version = 0
+
+    # Resolved instance paths of the form: {path: module-like object, ...}
+    self._path_cache = {}
+    # Resolved module names of the form: {name: module-like object or None}
+    self._resolve_cache = {}
+
+    # Parsed file contents of the form:
+    # {path: (st_mtime_ns, st_size, digest, [(name, instantiations), ...])}
+    self._parse_cache = {}
+
+    # (path, content digest) pairs registered by the current register_* call,
+    # so a file listed more than once only registers its modules once
+    self._seen_files = set()
+
   def iter_files_in_path(self, directory: Path):
     """
-    Generator for retriving all .SV files recursively from a particular
-    directory.
+    Generator for retriving all Verilog files recursively from a particular
+    directory. Walks with os.scandir so directory entries reuse their
+    cached file type instead of being stat'd and wrapped individually.
 
     Args:
         directory (Path): Path to search within.
     """
-    for p in directory.glob('**/*.[sv][v]'):
-      yield p
-
-  def strip_comments(self, content: str):
+    stack = [os.fspath(directory)]
+    while stack:
+      try:
+        with os.scandir(stack.pop()) as entries:
+          for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+              stack.append(entry.path)
+            elif (entry.name.endswith(self.VERILOG_EXTENSIONS)
+                  and entry.is_file()):
+              yield Path(entry.path)
+      except OSError as e:
+        LOGGER.warning(f'Could not scan Verilog directory: {e}')
+
+  def _get_cached_module_definitions(self, file: Path, file_stat):
+    cached = self._parse_cache.get(str(file))
+    if cached and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+      return cached[2:]
+    return None
+
+  def parse_verilog_files_parallel(self, files: list[Path]):
     """
-    Removes all comments (block or single-line) from a Verilog file.
+    Parses all files missing from the parse cache in a process pool, storing
+    the results in the parse cache. Subsequent `parse_verilog_file` calls for
+    these files are then served from the cache.
 
     Args:
-        file_content (str): Content of a Verilog file.
+        files (list[Path]): Verilog files to parse.
     """
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-    content = re.sub(r'//.*', '', content)
-    return content
+    stale = []
+    stale_bytes = 0
+    for file in files:
+      file_stat = file.stat()
+      if self._get_cached_module_definitions(file, file_stat) is None:
+        stale.append((file, file_stat))
+        stale_bytes += file_stat.st_size
+
+    num_cpus = os.cpu_count() or 1
+    if num_cpus < 2 or stale_bytes < self.PARALLEL_PARSE_MIN_BYTES:
+      return
+
+    num_chunks = -(-len(stale) // self.PARALLEL_PARSE_CHUNK_SIZE)
+    # Parsing can run on a Qt worker thread, where forking is unsafe. Spawned
+    # workers only import the standard-library-only parser module.
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(num_cpus, num_chunks),
+                             mp_context=mp_context) as executor:
+      results = executor.map(VerilogParser.read_module_definitions,
+                             [file for file, _ in stale],
+                             chunksize=self.PARALLEL_PARSE_CHUNK_SIZE)
+      for (file, file_stat), (digest, module_defs) in zip(stale, results):
+        self._parse_cache[str(file)] = (file_stat.st_mtime_ns,
+                                        file_stat.st_size, digest, module_defs)
   
+  def invalidate_geometry(self):
+    """
+    Marks all cached constraint geometry as stale.
+    """
+    self.geometry_version += 1
+
   def set_top_level_module(self, module):
     self.top_level = module
     ## TODO: Ideally, signal that the view needs to change from the root.
 
-  def parse_verilog_file(self, file: Path) -> list[tuple[VerilogModule, str]]:
+  def parse_verilog_file(self, file: Path) -> list[tuple[VerilogModule, list]]:
     """
     Parses all modules from a Verilog file.
 
@@ -168,69 +347,213 @@ class VerilogModuleHierarchy:
         file (Path): Path to the Verilog file to parse.
 
     Returns:
-        list[tuple[VerilogModule, str]]: List of tuples containing
-          (VerilogModule object, module body)
+        list[tuple[VerilogModule, list]]: List of tuples containing
+          (VerilogModule object, [(module name, instance name), ...])
     """
+    file_stat = file.stat()
+    cached = self._get_cached_module_definitions(file, file_stat)
+    if cached:
+      digest, module_defs = cached
+    else:
+      raw_content = VerilogParser.read_file_bytes(file)
+      digest = VerilogParser.digest_content(raw_content)
+      module_defs = VerilogParser.parse_module_definitions(raw_content)
+      self._parse_cache[str(file)] = (file_stat.st_mtime_ns, file_stat.st_size,
+                                      digest, module_defs)
+
+    seen_key = (str(file), digest)
+    if seen_key in self._seen_files:
+      LOGGER.debug("Skipping '%s', it was already registered", file)
+      return []
+    self._seen_files.add(seen_key)
+
     verilog_modules = []
-    with open(file, 'r') as verilog_file:
-      content = verilog_file.read()
-
-      # Remove comments
-      content = self.strip_comments(content)
-
-      # Find all module definitions
-      modules = re.findall(self.RE_MODULE_DEFINITION, content, re.MULTILINE)
-
-      # `modules` is a list of tuples with the following information:
-      # - [0]: Module Name; [2]: Module Body
-      for module_data in modules:
-        module_name, _, module_body = module_data
-        module = VerilogModule(module_name, file)
-        verilog_modules.append((module, module_body))
-        LOGGER.debug(f"Found module '{module}'")
+    for module_name, instantiations in module_defs:
+      module = VerilogModule(module_name, file, self, instantiations)
+      verilog_modules.append((module, instantiations))
+      LOGGER.debug("Found module '%s'", module)
     return verilog_modules
 
-  def parse_module_instances(self, module: tuple[VerilogModule, str]):
+  def load_parse_cache(self, path: Path):
     """
-    Gets all instances for a specific Verilog module and assign them to the
-    respective VerilogModule, logging those that haven't been loaded (i.e.,
-    LEFs)
+    Loads previously parsed Verilog file contents from a parse cache. Entries
+    are only reused if the file's modification time and size still match. An
+    unreadable or malformed cache is discarded as a whole.
 
     Args:
-        module (tuple[VerilogModule, str]): Module+body tuple to parse.
+        path (Path): Path to the parse cache file.
     """
-    vmodule, module_body = module
-    insts = re.findall(self.RE_MODULE_INSTANTIATION, module_body)
+    path = Path(path)
+    if not path.is_file():
+      return
+
+    try:
+      with open(path, 'rb') as cache_file:
+        version, entries = json.load(cache_file)
+      if version != self.PARSE_CACHE_VERSION:
+        LOGGER.info(f'Discarding outdated Verilog parse cache "{path}"')
+        return
+      parse_cache = {
+        file: self.validate_parse_cache_entry(entry)
+        for file, entry in entries.items()
+      }
+    except Exception as e:
+      LOGGER.warning(f'Discarding unreadable Verilog parse cache "{path}": {e}')
+      return
+    self._parse_cache.update(parse_cache)
 
-    for instance in insts:
-      inst_module_name, inst_name = instance
-      inst_obj = vmodule.instances.get(inst_name)
+  @staticmethod
+  def validate_parse_cache_entry(entry) -> tuple:
+    """
+    Converts a parse cache entry read from JSON back into its in-memory form.
+
+    Args:
+        entry: Deserialized [st_mtime_ns, st_size, digest, module definitions]
+          entry.
+
+    Raises:
+        ValueError: The entry is malformed.
+
+    Returns:
+        tuple: (st_mtime_ns, st_size, digest, [(module name, [(instantiated
+          module name, instance name), ...]), ...]) tuple.
+    """
+    mtime_ns, size, digest, module_defs = entry
+    if type(mtime_ns) is not int or type(size) is not int \
+        or not isinstance(digest, str):
+      raise ValueError(f'Malformed parse cache entry: {entry!r:.80}')
+    intern = sys.intern
+    # intern() also rejects anything that is not a string
+    return mtime_ns, size, digest, [
+      (intern(name), [(intern(inst_module_name), intern(inst_name))
+                      for inst_module_name, inst_name in instantiations])
+      for name, instantiations in module_defs
+    ]
+
+  def save_parse_cache(self, path: Path, files: list[Path]):
+    """
+    Writes the parse cache entries of the provided files to disk, so entries
+    of deleted or no longer listed files are dropped. The cache is written to
+    a temporary file first and then moved into place, so an interrupted write
+    never leaves a truncated cache behind.
+
+    Args:
+        path (Path): Path to the parse cache file.
+        files (list[Path]): Files registered alongside this cache.
+    """
+    path = Path(path)
+    parse_cache = self._parse_cache
+    entries = {}
+    for file in files:
+      entry = parse_cache.get(str(file))
+      if entry:
+        entries[str(file)] = entry
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+      with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+        json.dump((self.PARSE_CACHE_VERSION, entries), cache_file,
+                  separators=(',', ':'))
+      os.replace(tmp_path, path)
+    except OSError as e:
+      LOGGER.warning(f'Could not write Verilog parse cache "{path}": {e}')
+      tmp_path.unlink(missing_ok=True)
+
+  def parse_module_instances(self, module: tuple[VerilogModule, list]):
+    """
+    Resolves the instantiations found in a specific Verilog module and
+    assigns them to the respective VerilogModule, logging those that haven't
+    been loaded (i.e., LEFs)
+
+    Args:
+        module (tuple[VerilogModule, list]): Module and its (module name,
+          instance name) instantiation tuples (see
+          `VerilogParser.find_instantiations`).
+    """
+    vmodule, instantiations = module
+    instances = vmodule.instances
+    modules = self.modules
+    resolve_module_name = self.resolve_module_name
+    unknown_macros = self.unknown_macros
+    intern = sys.intern
+
+    for inst_module_name, inst_name in instantiations:
+      # Cached or worker results arrive as fresh, un-interned strings
+      inst_module_name = intern(inst_module_name)
+      inst_name = intern(inst_name)
+      inst_obj = instances.get(inst_name)
       
       if not inst_obj:
         inst_obj = VerilogModuleInstance(inst_name, inst_module_name)
-        vmodule.instances[inst_name] = inst_obj
-
-      if isinstance(inst_obj.module, VerilogModule):
-        # Was resolved before, should update to make sure nothing changed.
-        inst_obj.module = self.modules.get(
-          inst_obj.module.name, inst_obj.module.name)
-      elif isinstance(inst_obj.module, IRVMacro):
+        instances[inst_name] = inst_obj
+      elif inst_obj.module_name != inst_module_name:
+        # Instance now refers to a different module, drop the stale entry.
+        stale = unknown_macros.get(inst_obj.module_name)
+        if stale:
+          stale.discard(inst_obj)
+        inst_obj.module_name = inst_module_name
+        inst_obj.module = inst_module_name
+
+      # Unresolved instances still hold the module name as a plain string
+      kind = getattr(inst_obj.module, 'KIND', self.KIND_UNRESOLVED)
+      if kind == self.KIND_MACRO:
         continue
-      elif isinstance(inst_obj.module, str):
+      if kind == self.KIND_MODULE:
+        # Was resolved before, should update to make sure nothing changed.
+        module = modules.get(inst_module_name)
+      else:
         # Not resolved yet, attempt to resolve.
-        inst_obj.module = self.macro_library.get_macro(inst_obj.module) \
-          or self.modules.get(inst_obj.module, inst_obj.module)
-        
-        # Remove from unknown macros (if it exists)
-        if inst_obj in self.unknown_macros[inst_name]:
-          self.unknown_macros[inst_name].remove(inst_obj)
-
-      if isinstance(inst_obj.module, str):
+        module = resolve_module_name(inst_module_name)
+
+      if module is None:
         # If after the earlier steps it is still unresolved, log for later.
-        self.unknown_macros[inst_name].add(inst_obj)
+        inst_obj.module = inst_module_name
+        unknown_macros[inst_module_name].add(inst_obj)
+      else:
+        inst_obj.module = module
+        # Never create a set for a name that was never unresolved.
+        unresolved = unknown_macros.get(inst_module_name)
+        if unresolved:
+          unresolved.discard(inst_obj)
+          if not unresolved:
+            del unknown_macros[inst_module_name]
 
     # full_instance_path = '/'.join([parent_path, inst_name]) if parent_path else inst_name
 
+  def resolve_module_name(self, name: str) -> 'VerilogModule | IRVMacro | None':
+    """
+    Resolves a module name to its macro or, failing that, its VerilogModule.
+    Names repeat across many instances (e.g., standard cells), so results are
+    memoized until `invalidate_resolution` is called.
+
+    Args:
+        name (str): Name of the instantiated module.
+
+    Returns:
+        VerilogModule | IRVMacro | None: Resolved module, or None if unknown.
+    """
+    try:
+      return self._resolve_cache[name]
+    except KeyError:
+      module = self.macro_library.get_macro(name) or self.modules.get(name)
+      self._resolve_cache[name] = module
+      return module
+
+  def resolve_unknown_instances(self):
+    """
+    Resolves instances whose module could not be found when they were parsed
+    (i.e., modules registered by a later file set or macros loaded later), so
+    lookups never have to resolve module names themselves.
+    """
+    resolve_module_name = self.resolve_module_name
+    unknown_macros = self.unknown_macros
+    for module_name in list(unknown_macros):
+      module = resolve_module_name(module_name)
+      if module is None:
+        continue
+      # Every unresolved instance of this module is retired at once
+      for inst_obj in unknown_macros.pop(module_name):
+        inst_obj.module = module
+
   def register_irv_settings(self, driver: HammerDriver):
     """
     Registers all IRV-namespaced settings relevant to verilog module parsing.
@@ -243,67 +566,82 @@ class VerilogModuleHierarchy:
     #driver.database.get_config('irv.')
 
   def register_modules_from_driver(self, driver: HammerDriver,
-                                      statusbar: QtWidgets.QStatusBar | None):
+                                      statusbar: StatusBarLogger):
     """
     Registers all .sv files as IRView VerilogModule objects for the current
     VerilogModuleHierarchy based on `synthesis.inputs.input_files`.
 
     Args:
         driver (HammerDriver): Associated Hammer driver
-        statusbar (QStatusBar): Status bar to update with progress.
+        statusbar (StatusBarLogger): Status bar to update with progress.
     """
     self.driver = driver
+    cache_path = Path(driver.obj_dir, self.PARSE_CACHE_FILENAME)
     modules_found = []
 
-    files = driver.project_config.get('synthesis.inputs.input_files', [])
+    self.load_parse_cache(cache_path)
+    self._seen_files = set()
+
+    files = [Path(vfile) for vfile in
+             driver.project_config.get('synthesis.inputs.input_files', [])]
     num_files = len(files)
+    statusbar.showMessage(f"Parsing {num_files} synthesis input files")
+    self.parse_verilog_files_parallel(files)
 
     # Parse modules as a flat structure
     for i, vfile in enumerate(files):
-      vfile = Path(vfile)
-      statusbar.showMessage(f"Parsing synthesis module {i+1} of {num_files}: {vfile}")
+      statusbar.showProgress(f"Parsing synthesis module {i+1} of {num_files}: {vfile}")
       # Update our registry with the found verilog files.
       modules = self.parse_verilog_file(vfile)
       for module in modules:
-        vmodule_obj, module_body = module
+        vmodule_obj, _ = module
         self.modules[vmodule_obj.name] = vmodule_obj
         modules_found.append(module)
 
-    # All modules loaded from all files. Parse instance hierarchy
-    for module_tpl in modules_found:
-      vmodule_obj, module_body = module_tpl
-      statusbar.showMessage(f"Reading instances for module '{vmodule_obj.name}'")
-      self.parse_module_instances(module_tpl)
+    self.save_parse_cache(cache_path, files)
+
+    # Instances are parsed lazily on first access to `VerilogModule.instances`
+    statusbar.showMessage(f'Loaded {len(modules_found)} Verilog modules')
+
+    self.invalidate_resolution()
 
   def register_modules_from_directory(self, directory: Path,
-                                      statusbar: QtWidgets.QStatusBar | None):
+                                      statusbar: StatusBarLogger):
     """
     Registers all .sv files as IRView VerilogModule objects for the current
     VerilogModuleHierarchy.
 
     Args:
         directory (Path): Path to .sv files.
-        statusbar (QStatusBar): Status bar to update with progress.
+        statusbar (StatusBarLogger): Status bar to update with progress.
     """
     directory = Path(directory)
+    cache_path = directory / self.PARSE_CACHE_FILENAME
     modules_found = []
 
+    self.load_parse_cache(cache_path)
+    self._seen_files = set()
+
+    files = list(self.iter_files_in_path(directory))
+    statusbar.showMessage(f"Parsing {len(files)} Verilog files in '{directory}'")
+    self.parse_verilog_files_parallel(files)
+
     # Parse modules as a flat structure
-    for vfile in self.iter_files_in_path(directory):
-      statusbar.showMessage(f"Parsing '{vfile}'")
+    for vfile in files:
+      statusbar.showProgress(f"Parsing '{vfile}'")
       # Update our registry with the found verilog files.
       modules = self.parse_verilog_file(vfile)
       for module in modules:
-        vmodule_obj, module_body = module
+        vmodule_obj, _ = module
         self.modules[vmodule_obj.name] = vmodule_obj
         modules_found.append(module)
 
+    self.save_parse_cache(cache_path, files)
+
+    # Instances are parsed lazily on first access to `VerilogModule.instances`
+    statusbar.showMessage(f'Loaded {len(modules_found)} Verilog modules')
 
-    # All modules loaded from all files. Parse instance hierarchy
-    for module_tpl in modules_found:
-      vmodule_obj, module_body = module_tpl
-      statusbar.showMessage(f"Reading instances for module '{vmodule_obj.name}'")
-      self.parse_module_instances(module_tpl)
+    self.invalidate_resolution()
 
 
   def register_hammer_extra_libraries(self, driver: HammerDriver, statusbar):
@@ -314,17 +652,30 @@ class VerilogModuleHierarchy:
       lef_path = lib.get('lef_file', None)
       if lef_path:
         lef_path = Path(driver.obj_dir, lef_path)
-        statusbar.showMessage(f'Loading extra library {i+1} of {num_libs}: {lef_path}')
+        statusbar.showProgress(f'Loading extra library {i+1} of {num_libs}: {lef_path}')
         self.macro_library.add_by_path(lef_path)
+    statusbar.showMessage(f'Loaded {num_libs} extra libraries')
+    self.invalidate_resolution()
 
   def register_hammer_tech_libraries(self, driver: HammerDriver, statusbar):
     num_libs = len(driver.tech.tech_defined_libraries)
     for i, lib in enumerate(driver.tech.tech_defined_libraries):
-      statusbar.showMessage(f'Lazily loading technology library {i+1} of {num_libs}: {lib.name}')
+      statusbar.showProgress(f'Lazily loading technology library {i+1} of {num_libs}: {lib.name}')
       if lib.lef_file:
         self.macro_library.add_lazy_by_path(lib.name, lib.lef_file)
+    statusbar.showMessage(f'Registered {num_libs} technology libraries')
+    self.invalidate_resolution()
+
+  def invalidate_resolution(self):
+    """
+    Re-resolves instances after modules or macros are registered, and drops
+    memoized module names and instance paths that may now resolve differently.
+    """
+    self._resolve_cache.clear()
+    self.resolve_unknown_instances()
+    self._path_cache.clear()
   
-  def register_constraints_in_driver(self, driver: HammerDriver, statusbar: QtWidgets.QStatusBar | None):
+  def register_constraints_in_driver(self, driver: HammerDriver, statusbar: StatusBarLogger):
     """
     Registers all constraints from a provided HAMMER YML file.
 
@@ -338,10 +689,22 @@ class VerilogModuleHierarchy:
     
     constraints = driver.project_config.get('vlsi.inputs.placement_constraints', [])
     num_constraints = len(constraints)
+    deserialize = PlacementConstraintManager.deserialize
+    show_progress = statusbar.showProgress
     for i, constraint in enumerate(constraints):
-      statusbar.showMessage(f'Deserializing placement constraint {i+1} of {num_constraints}')
-      constraint_obj = PlacementConstraintManager.deserialize(constraint, self)
+      show_progress(f'Deserializing placement constraint {i+1} of {num_constraints}')
+      constraint_obj = deserialize(constraint, self)
       constraint_obj.module.add_constraint(constraint_obj)
+    statusbar.showMessage(f'Loaded {num_constraints} placement constraints')
+    self.invalidate_geometry()
+
+    # Constraints only resolved the instances along their paths. Resolve the
+    # rest while still on the loader thread, since resolution can load LEFs.
+    num_modules = len(self.modules)
+    for i, module in enumerate(self.modules.values()):
+      show_progress(f'Resolving instances of module {i+1} of {num_modules}')
+      module.resolve_instances()
+    statusbar.showMessage(f'Resolved instances of {num_modules} modules')
     # if 
 
     # if constraint_obj.module.add_constr
@@ -361,18 +724,30 @@ class VerilogModuleHierarchy:
     return self.modules.get(name)
   
   def get_module_by_path(self, path):
+    """
+    Resolves an instance path (i.e., `Top/u_sub/mem0`) to the module or macro
+    it instantiates. Results are memoized until modules are registered again.
+
+    Args:
+        path (str): Slash-delimited instance path, starting at a module name.
+
+    Returns:
+        Union[VerilogModule, IRVMacro, str, None]: The instantiated module,
+            macro, unresolved module name, or None if it doesn't exist.
+    """
+    if path not in self._path_cache:
+      self._path_cache[path] = self._resolve_module_path(path)
+    return self._path_cache[path]
+
+  def _resolve_module_path(self, path):
     segments = path.split('/')
     current = self.get_module_by_name(segments[0])
     for segment in segments[1:]:
-      if isinstance(current, VerilogModule):
-        inst = current.instances.get(segment)
-        if isinstance(inst, VerilogModuleInstance):
-          current = inst.module
-        else:
-          current = inst
-      elif isinstance(current, IRVMacro) or isinstance(current, str):
-        return current
-      else:
+      if current is None:
         return None
+      if getattr(current, 'KIND', self.KIND_UNRESOLVED) != self.KIND_MODULE:
+        # Macros and unresolved names have no instances to descend into.
+        return current
+      inst = current.instances.get(segment)
+      current = inst.module if inst else None
     return current
-
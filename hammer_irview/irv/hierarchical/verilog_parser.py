@@ -0,0 +1,277 @@
+"""
+Verilog source scanning. This module only depends on the standard library, so
+parse worker processes can import it without loading Qt or Hammer.
+"""
+import hashlib
+import os
+from pathlib import Path
+import re
+import sys
+
+
+class VerilogParser:
+  """
+  Extracts module definitions and instantiations from Verilog sources. All
+  methods return plain data, so they can run in a worker process.
+  """
+
+  RE_IDENTIFIER = r'\w+'
+  """
+  Pattern to match a Verilog identifier (i.e., a module name).
+  """
+
+  RE_MODULE_INSTANTIATION = r'\b(\w+)\s+(\w+)\s*\('
+  """
+  Pattern to find Verilog module instantiations within a module's body. The
+  leading word boundary stops the engine from retrying a failed match from
+  every character within an identifier.
+  """
+
+  RE_COMMENT = r'/\*[^*]*\*+(?:[^/*][^*]*\*+)*/|//[^\n]*'
+  """
+  Pattern to find a Verilog block or single-line comment. Block comments use
+  an unrolled loop instead of a lazy `.*?`, so the engine never retries the
+  comment end at every character.
+  """
+
+  RE_COMMENT_OR_STRING = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"|' + RE_COMMENT
+  """
+  Pattern to find a Verilog comment or string literal, so that comment markers
+  within strings (e.g., `"http://..."`) can be kept.
+  """
+
+  VERILOG_KEYWORDS = frozenset((
+    'always', 'always_comb', 'always_ff', 'always_latch', 'assert', 'assign',
+    'assume', 'begin', 'bit', 'byte', 'case', 'casex', 'casez', 'cover',
+    'default', 'disable', 'do', 'else', 'end', 'endcase', 'endfunction',
+    'endgenerate', 'endmodule', 'endtask', 'for', 'foreach', 'forever', 'fork',
+    'function', 'generate', 'genvar', 'if', 'initial', 'inout', 'input', 'int',
+    'integer', 'join', 'localparam', 'logic', 'module', 'negedge', 'or',
+    'output', 'parameter', 'posedge', 'real', 'reg', 'repeat', 'return',
+    'task', 'unique', 'while', 'wire',
+  ))
+  """
+  Verilog keywords that can precede a parenthesis (e.g., `end else if (`),
+  which are never module or instance names.
+  """
+
+  _RE_IDENTIFIER = re.compile(RE_IDENTIFIER)
+  _RE_MODULE_INSTANTIATION = re.compile(RE_MODULE_INSTANTIATION)
+  _RE_COMMENT = re.compile(RE_COMMENT)
+  _RE_COMMENT_OR_STRING = re.compile(RE_COMMENT_OR_STRING)
+
+  @classmethod
+  def strip_comments(cls, content: str):
+    """
+    Removes all comments (block or single-line) from a Verilog file.
+
+    Args:
+        file_content (str): Content of a Verilog file.
+    """
+    # Substring searches are far cheaper than a regex pass over the file.
+    if '//' not in content and '/*' not in content:
+      return content
+    if '"' not in content:
+      return cls._RE_COMMENT.sub('', content)
+    # Only pay for matching string literals when the file has any.
+    return cls._RE_COMMENT_OR_STRING.sub(cls._keep_string_literal, content)
+
+  @staticmethod
+  def _keep_string_literal(match: re.Match) -> str:
+    text = match.group()
+    return text if text[0] == '"' else ''
+
+  @classmethod
+  def read_module_definitions(cls, file: Path) -> tuple[str, list]:
+    """
+    Reads all module definitions from a Verilog file. This only returns plain
+    data, so it can be run in a worker process.
+
+    Args:
+        file (Path): Path to the Verilog file to parse.
+
+    Returns:
+        tuple[str, list]: Content digest of the file and its module
+          definitions (see `parse_module_definitions`).
+    """
+    raw_content = cls.read_file_bytes(file)
+    return cls.digest_content(raw_content), \
+      cls.parse_module_definitions(raw_content)
+
+  @staticmethod
+  def digest_content(raw_content: bytes) -> str:
+    return hashlib.blake2b(raw_content, digest_size=8).hexdigest()
+
+  @classmethod
+  def parse_module_definitions(cls, raw_content: bytes) -> list:
+    """
+    Parses all module definitions from raw Verilog file contents. Each body
+    is scanned for instantiations in place as soon as it is found, so bodies
+    are never copied out of the file contents.
+
+    Args:
+        raw_content (bytes): Raw contents of a Verilog file.
+
+    Returns:
+        list[tuple[str, list[tuple[str, str]]]]: List of (module name,
+          [(instantiated module name, instance name), ...]) tuples.
+    """
+    # Headers and package files often define no modules at all, so skip the
+    # decode and comment stripping when the keyword never appears.
+    if b'endmodule' not in raw_content:
+      return []
+
+    # Decode the raw bytes in one pass; latin-1 never fails and maps ASCII
+    # Verilog one-to-one, skipping the text I/O layer's newline translation.
+    content = raw_content.decode('latin-1')
+
+    # Remove comments
+    content = cls.strip_comments(content)
+    if 'endmodule' not in content:
+      return []
+
+    return [(name, cls.find_instantiations(content, start, end))
+            for name, start, end in cls.scan_module_definitions(content)]
+
+  @classmethod
+  def find_instantiations(cls, content: str, start: int = 0,
+                          end: int | None = None) -> list[tuple[str, str]]:
+    """
+    Finds all module instantiations within a module body.
+
+    Args:
+        content (str): Comment-free Verilog source.
+        start (int): Index at which the module body starts.
+        end (int | None): Index at which the module body ends, or None for the
+          end of `content`.
+
+    Returns:
+        list[tuple[str, str]]: List of (instantiated module name, instance
+          name) tuples.
+    """
+    if end is None:
+      end = len(content)
+    if content.find('(', start, end) < 0:
+      # Every instantiation has a port list, so there is nothing to find.
+      return []
+
+    # Identifiers repeat across the design, so share one string per name.
+    # This also lets pickle deduplicate them when results leave a worker.
+    intern = sys.intern
+    keywords = cls.VERILOG_KEYWORDS
+    return [(intern(inst_module_name), intern(inst_name))
+            for inst_module_name, inst_name
+            in cls._RE_MODULE_INSTANTIATION.findall(content, start, end)
+            if inst_module_name not in keywords and inst_name not in keywords]
+
+  @staticmethod
+  def read_file_bytes(file: Path) -> bytes:
+    """
+    Reads a whole file with raw OS reads sized from its stat, bypassing the
+    buffered I/O objects `open()` would allocate.
+
+    Args:
+        file (Path): Path to the file to read.
+
+    Returns:
+        bytes: File contents.
+    """
+    fd = os.open(file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+      remaining = os.fstat(fd).st_size
+      chunks = []
+      # Keep reading past the stat'd size in case of short reads or growth.
+      while chunk := os.read(fd, max(remaining, 1 << 16)):
+        chunks.append(chunk)
+        remaining -= len(chunk)
+      return b''.join(chunks)
+    finally:
+      os.close(fd)
+
+  @staticmethod
+  def skip_whitespace(content: str, pos: int) -> int:
+    while pos < len(content) and content[pos].isspace():
+      pos += 1
+    return pos
+
+  @staticmethod
+  def skip_parentheses(content: str, pos: int) -> int:
+    """
+    Skips a balanced parenthesized list starting at an opening parenthesis.
+
+    Args:
+        content (str): Comment-free Verilog source.
+        pos (int): Index of the opening parenthesis.
+
+    Returns:
+        int: Index just past the matching closing parenthesis, or -1 if the
+          list is never closed.
+    """
+    depth = 0
+    while True:
+      close = content.find(')', pos)
+      if close < 0:
+        return -1
+      depth += content.count('(', pos, close) - 1
+      pos = close + 1
+      if depth <= 0:
+        return pos
+
+  @classmethod
+  def scan_module_definitions(cls, content: str):
+    """
+    Scans comment-free Verilog source for module definitions in a single
+    forward pass. Parameter and port lists are skipped by counting
+    parentheses, so nested expressions (e.g., `$clog2(DEPTH)`) are handled
+    and no backtracking occurs.
+
+    Args:
+        content (str): Comment-free Verilog source.
+
+    Yields:
+        tuple[str, int, int]: (module name, body start, body end) tuples, with
+          the body spanning `content[start:end]`.
+    """
+    skip_ws = cls.skip_whitespace
+    skip_parens = cls.skip_parentheses
+    match_identifier = cls._RE_IDENTIFIER.match
+
+    pos = content.find('module')
+    while pos >= 0:
+      name_start = skip_ws(content, pos + 6)
+      # Must be a standalone keyword (i.e., not `endmodule` or `module_x`)
+      if (pos > 0 and (content[pos - 1].isalnum() or content[pos - 1] == '_')) \
+          or name_start == pos + 6:
+        pos = content.find('module', pos + 6)
+        continue
+
+      name_match = match_identifier(content, name_start)
+      if not name_match:
+        pos = content.find('module', name_start)
+        continue
+      i = skip_ws(content, name_match.end())
+
+      # Optional parameter list: #( ... )
+      if content.startswith('#', i):
+        i = skip_ws(content, i + 1)
+        if content.startswith('(', i):
+          i = skip_parens(content, i)
+          if i >= 0:
+            i = skip_ws(content, i)
+
+      # Port list: ( ... )
+      if i >= 0 and content.startswith('(', i):
+        i = skip_parens(content, i)
+        if i >= 0:
+          i = skip_ws(content, i)
+
+      if i < 0 or not content.startswith(';', i):
+        pos = content.find('module', name_match.end())
+        continue
+
+      body_start = i + 1
+      end = content.find('endmodule', body_start)
+      if end < 0:
+        return
+      yield name_match.group(), body_start, end
+      pos = content.find('module', end + 9)
@@ -1,7 +1,6 @@
 """
 Convenience class for handling YML parsing.
 """
-from collections import OrderedDict
 import os
 import logging
 from pathlib import Path
@@ -22,6 +21,8 @@ class HammerYaml:
 
   def __init__(self, path: Path):
     self.yml_file = Path(path)
+    # Resolved values by dot-delimited key, cleared whenever a value is set
+    self._value_cache = {}
 
     if not self.yml_file.is_file():
       LOGGER.warning(f'YML file path "{self.yml_file}" does not exist.')
@@ -40,6 +41,7 @@ class HammerYaml:
         key (str): Dot-delimited key (i.e., `vlsi.inputs`)
         value (Any): Value to assign for the specified key.
     """
+    self._value_cache.clear()
     key_parts = key.split('.')
 
     current_dict = self.data
@@ -58,16 +60,17 @@ class HammerYaml:
     Args:
         key (str): Dot-delimited key (i.e., `vlsi.inputs`)
     """
-    key_parts = key.split('.')
-
-    current_dict = self.data
-    for part_idx, part in enumerate(key_parts):
-      if part_idx < len(key_parts) - 1:
-        if part not in current_dict:
-          current_dict[part] = {}
-        current_dict = current_dict[part]
-      else:
-        return current_dict.get(part)
+    if key in self._value_cache:
+      return self._value_cache[key]
+
+    # Missing intermediate keys resolve to None instead of being created.
+    value = self.data
+    for part in key.split('.'):
+      value = value.get(part) if isinstance(value, dict) else None
+      if value is None:
+        break
+    self._value_cache[key] = value
+    return value
 
 
   def flatten_data(self, data: Union[dict, list]):
@@ -14,7 +14,7 @@ except ImportError:
 
 from PySide6.QtUiTools import QUiLoader
 from PySide6.QtWidgets import QFileDialog, QHeaderView
-from PySide6.QtCore import QFile, QFileInfo, QIODevice, QModelIndex
+from PySide6.QtCore import QFile, QFileInfo, QIODevice, QModelIndex, QTimer
 
 from pyqtgraph.parametertree import ParameterTree
 
@@ -27,6 +27,12 @@ LOGGER = logging.getLogger(__name__)
 class MainWindow:
   UI_PATH = IRVBehavior.UI_PATH / 'main.ui'
 
+  RESIZE_DRAW_DELAY_MS = 16
+  """
+  Delay after the last window resize event before the current canvas is
+  redrawn.
+  """
+
   def _load_ui(self, path, parent):
     # Initialize uic for included UI file path
     ui_file = QFile(path)
@@ -52,6 +58,13 @@ class MainWindow:
     # Loading modal
     self.loader_modal = LoadingWidget('Please wait...', self.ui)
 
+    # Window resizes arrive many times a second while dragging, so only
+    # redraw once they settle
+    self.resize_timer = QTimer(self.ui)
+    self.resize_timer.setSingleShot(True)
+    self.resize_timer.setInterval(self.RESIZE_DRAW_DELAY_MS)
+    self.resize_timer.timeout.connect(self.handleResizeSettled)
+
     # Event handling
     self.ui.resizeEvent = self.handleResize
     self.ui.designHierarchyTree.doubleClicked.connect(self.handleDesignHierarchyDoubleClick)
@@ -65,21 +78,29 @@ class MainWindow:
     #self._update_design_hierarchy_model()
 
   def action_zoom_to_fit(self):
-    print('zoom to fit init called')
+    LOGGER.debug('Zooming to fit')
     self.ui.tabs.currentWidget().zoom_to_fit()
 
   def _update_design_hierarchy_model(self):
     self.ui.designHierarchyTree.setModel(self.designHierarchyModel)
 
   def __init__(self, parent=None):
+    self.param_constraint = None
+    self.watched_selection = None
+    self.sram_configs = {}
     self._load_ui(self.UI_PATH, parent)
     self.ui.show()
 
-  def handleResize(self):
-    self.ui.tabs.currentWidget().draw()
+  def handleResize(self, event=None):
+    self.resize_timer.start()
+
+  def handleResizeSettled(self):
+    canvas = self.ui.tabs.currentWidget()
+    if canvas:
+      canvas.draw_idle()
 
   def handleDesignHierarchyDoubleClick(self, item: QModelIndex):
-    module = item.internalPointer()
+    module = self.designHierarchyModel.get_module(item)
     if module:
       self.open_module(module)
 
@@ -92,12 +113,20 @@ class MainWindow:
       canvas.render_module()
       self.select_artist(canvas, canvas.selected)
       self.ui.actionRenderHierarchical.checked = canvas.render_hierarchy
-      self.ui.moduleHierarchyTree.setSelectionModel(view_model.selection_model)
 
+    # setModel replaces the selection model, so restore the module's own after
     self.ui.moduleHierarchyTree.setModel(view_model)
+    if view_model:
+      self.ui.moduleHierarchyTree.setSelectionModel(view_model.selection_model)
+      self.watch_selection_model(view_model.selection_model)
 
   def handleCloseTab(self, index):
+    canvas = self.ui.tabs.widget(index)
     self.ui.tabs.removeTab(index)
+    # removeTab doesn't delete the page, so free the canvas and its figure.
+    if canvas:
+      canvas.release()
+      canvas.deleteLater()
 
 
   def handleActionRenderHierarchical(self):
@@ -108,38 +137,53 @@ class MainWindow:
 
   def handleActionLoadSramCompiler(self):
     # First load seq_mems.json, then load sram_generator-output.json
-    self.dialog = QFileDialog(self.ui)
-
-    self.dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
-    self.dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
-    self.dialog.setWindowTitle('Open mems.conf...')
-    self.dialog.open()
-
-    if not self.dialog.selectedFiles:
+    path_conf, _ = QFileDialog.getOpenFileName(self.ui, 'Open mems.conf...')
+    if not path_conf:
       return
-    
+
     # Have mems.conf, can get mapping of module -> sram characteristics
-    path_conf = self.dialog.selectedFiles()
-    with open(path_conf, 'r') as conf:
+    self.sram_configs = self.parse_mems_conf(path_conf)
+    self.ui.statusbar.showMessage(
+      f'Loaded {len(self.sram_configs)} SRAM configurations from {path_conf}')
+
+  @staticmethod
+  def parse_mems_conf(path) -> dict[str, dict[str, str]]:
+    """
+    Parses a memory configuration file, where each line is of the form
+    `name cc_dir_ext depth ## width ## ports ### mask_gran ##`.
+
+    Args:
+        path: Path to the mems.conf file.
+
+    Returns:
+        dict[str, dict[str, str]]: Characteristics of each memory by module
+          name, such as {'depth': '##', 'width': '##', ...}.
+    """
+    configs = {}
+    with open(path, 'r') as conf:
       for line in conf:
-        line = line.strip()
-        line_elems = ' '.split(line)
-        # Example: name cc_dir_ext depth ## width ## ports ### mask_gran ##
+        fields = line.split()
+        if len(fields) < 2 or fields[0] != 'name':
+          continue
+        # Remaining fields alternate between keys and values
+        configs[fields[1]] = dict(zip(fields[2::2], fields[3::2]))
+    return configs
 
   def handleMplZoom(self, event):
     event.canvas.handle_resize()
 
   def handleMplClick(self, event):
-    artist = event.artist
-    if artist and event.mouseevent.button == 1:
-      constraint = event.canvas.artist_to_constraint[artist]
-      print(constraint)
+    if event.button != 1 or not event.inaxes:
+      return
+    constraint = event.canvas.constraint_at(event.xdata, event.ydata)
+    if constraint:
+      LOGGER.debug('Selected constraint %s', constraint.path)
       self.select_artist(event.canvas, constraint)
 
   def handleConstraintHierarchyClick(self, item: QModelIndex):
     indexes = item.indexes()
     if indexes:
-      constraint = indexes[0].internalPointer()
+      constraint = indexes[0].internalPointer().item
       self.select_artist(self.ui.tabs.currentWidget(), constraint)
 
   def select_artist(self, canvas, constraint):
@@ -147,7 +191,38 @@ class MainWindow:
       canvas.select_constraint(constraint)
       idx = canvas.module.view_model.get_constraint_index(constraint)
       constraint.populate_params(self.paramtree)
-      self.ui.moduleHierarchyTree.setCurrentIndex(idx)
+      self.watch_constraint_params(constraint)
+      if idx.isValid():
+        self.ui.moduleHierarchyTree.setCurrentIndex(idx)
+
+  def watch_selection_model(self, selection_model):
+    # Only the selection model shown in the constraints tree is listened to
+    if self.watched_selection is selection_model:
+      return
+    if self.watched_selection:
+      self.watched_selection.selectionChanged.disconnect(
+        self.handleConstraintHierarchyClick)
+    self.watched_selection = selection_model
+    selection_model.selectionChanged.connect(
+      self.handleConstraintHierarchyClick)
+
+  def watch_constraint_params(self, constraint):
+    # Only the constraint shown in the parameter tree can be edited
+    if self.param_constraint is constraint:
+      return
+    if self.param_constraint:
+      self.param_constraint.params.sigTreeStateChanged.disconnect(
+        self.handleConstraintParamsChanged)
+    self.param_constraint = constraint
+    constraint.params.sigTreeStateChanged.connect(
+      self.handleConstraintParamsChanged)
+
+  def handleConstraintParamsChanged(self, param, changes):
+    if not any(change == 'value' for _, change, _ in changes):
+      return
+    canvas = self.ui.tabs.currentWidget()
+    if canvas and canvas.selected is self.param_constraint:
+      canvas.update_constraint(self.param_constraint)
 
   def mouse_hover_statusbar_update(self, event):
     if event.xdata and event.ydata:
@@ -168,26 +243,31 @@ class MainWindow:
     canvas = MplCanvas(None, module)
     canvas.zoom_to_fit()
     canvas.mpl_connect('motion_notify_event', self.mouse_hover_statusbar_update)
-    canvas.mpl_connect('pick_event', self.handleMplClick)
+    canvas.mpl_connect('button_press_event', self.handleMplClick)
     canvas.mpl_connect('resize_event', self.handleMplZoom)
     self.ui.tabs.setCurrentIndex(self.ui.tabs.addTab(canvas, module.name))
-    self.ui.moduleHierarchyTree.selectionModel().selectionChanged.connect(self.handleConstraintHierarchyClick)
     self.ui.statusbar.showMessage(f"Module {module.name} loaded.")
     #canvas.render_module(module)
 
   def load_hammer_data(self, driver: HammerDriver):
-    # parse out the stuff
-    self.loader_modal.show()
+    """
+    Parses libraries, Verilog modules and placement constraints from a Hammer
+    driver. This runs on a worker thread, so it only reports progress through
+    the status bar logger and leaves widget updates to
+    `handle_hammer_data_loaded`.
+
+    Args:
+        driver (HammerDriver): Associated Hammer driver
+    """
     self.vhierarchy = VerilogModuleHierarchy()
     self.vhierarchy.register_irv_settings(driver)
 
-    self.ui.statusbar.showMessage(f'Loading HAMMER libraries...')
+    self.statusbar_logger.showMessage(f'Loading HAMMER libraries...')
 
-    self.vhierarchy.register_hammer_tech_libraries(driver, self.ui.statusbar)
-    self.vhierarchy.register_hammer_extra_libraries(driver, self.ui.statusbar)
+    self.vhierarchy.register_hammer_tech_libraries(driver, self.statusbar_logger)
+    self.vhierarchy.register_hammer_extra_libraries(driver, self.statusbar_logger)
 
-    self.ui.statusbar.showMessage(f"Parsing Verilog hierarchy...")
-    self.designHierarchyModel = VerilogModuleHierarchyScopedModel(self.vhierarchy)
+    self.statusbar_logger.showMessage(f"Parsing Verilog hierarchy...")
     self.vhierarchy.register_modules_from_driver(driver, self.statusbar_logger)
     self.vhierarchy.register_constraints_in_driver(driver, self.statusbar_logger)
 
@@ -196,8 +276,13 @@ class MainWindow:
       toplevel_module = self.vhierarchy.get_module_by_name(toplevel_name)
       self.vhierarchy.set_top_level_module(toplevel_module)
 
+  def handle_hammer_data_loaded(self):
+    self.designHierarchyModel = VerilogModuleHierarchyScopedModel(self.vhierarchy)
     self._update_design_hierarchy_model()
     self.loader_modal.hide()
 
     self.ui.statusbar.showMessage(f'Ready.')
 
+  def handle_hammer_data_failed(self, error: str):
+    self.loader_modal.hide()
+    self.ui.statusbar.showMessage(f'Failed to load HAMMER data: {error}')
@@ -1,6 +1,6 @@
 
 
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 import logging
 import typing
 from typing_extensions import Self
@@ -27,7 +27,7 @@ class DesignHierarchyModule:
     if placement_constraints:
       self.placement_constraints = placement_constraints
     else:
-      self.placement_constraints = OrderedDict()
+      self.placement_constraints = {}
     self.placement_constraints_list = []
     self.constraints_indices = {}
 
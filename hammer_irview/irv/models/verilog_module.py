@@ -9,7 +9,7 @@ import typing
 from PySide6 import QtCore, QtGui
 
 from hammer.hammer.tech.stackup import RoutingDirection
-from hammer_irview.irv.hierarchical.placement_constraints import IRVAlignCheck, ModuleConstraint, ModuleHierarchical
+from hammer_irview.irv.hierarchical.placement_constraints import IRVAlignCheck, ModuleConstraint, ModuleHierarchical, PlacementConstraintManager
 
 from typing import TYPE_CHECKING
 
@@ -21,53 +21,99 @@ if TYPE_CHECKING:
 LOGGER = logging.getLogger(__name__)
 
 
+class TreeNode:
+  """
+  Row of a tree model. A master module's constraints are shown under every
+  hierarchical constraint placing it, so the same object can appear in many
+  rows; nodes give each row its own parent and row number instead.
+  """
+
+  __slots__ = ('item', 'parent', 'row', '_children')
+
+  def __init__(self, item, parent: 'TreeNode | None' = None, row: int = 0):
+    self.item = item
+    self.parent = parent
+    self.row = row
+    self._children = None
+
+  def children(self, model) -> list['TreeNode']:
+    """
+    Returns the child rows of this node, created on first access.
+
+    Args:
+        model: Model providing `child_items(item)`.
+    """
+    if self._children is None:
+      self._children = [TreeNode(item, self, row) for row, item
+                        in enumerate(model.child_items(self.item))]
+    return self._children
+
+
 class VerilogModuleHierarchyScopedModel(QtCore.QAbstractItemModel):
 
-  # Internal Pointer managed as VerilogModule objects.
+  # Internal Pointer managed as TreeNode objects, wrapping the top level
+  # VerilogModule and the hierarchical constraints below it.
 
   def __init__(self, hierarchy: 'VerilogModuleHierarchy'):
     super().__init__()
     self.hierarchy = hierarchy
     self.selection_model = QtCore.QItemSelectionModel(self)
+    self._roots = None
+
+  ### --- Custom --- ###
+
+  def roots(self) -> list[TreeNode]:
+    if self._roots is None:
+      top_level = self.hierarchy.top_level
+      self._roots = [TreeNode(top_level)] if top_level else []
+    return self._roots
+
+  def child_items(self, item) -> list:
+    # Hierarchical constraints expand into their master module's children
+    module = item.master_module if isinstance(item, ModuleConstraint) else item
+    return getattr(module, 'children', [])
+
+  def get_module(self, index: QtCore.QModelIndex) -> 'VerilogModule | None':
+    """
+    Returns the module shown at an index, which for hierarchical constraints
+    is their master module.
+    """
+    if not index.isValid():
+      return None
+    item = index.internalPointer().item
+    if isinstance(item, ModuleConstraint):
+      return item.master_module
+    return item
+
+  ### --- QAbstractItemModel --- ###
 
   def index(self, row:int, column:int, parent:typing.Optional[QtCore.QModelIndex]=QtCore.QModelIndex()) -> QtCore.QModelIndex:
     """Returns the index of the item in the model specified by the given row, column and parent index."""
     if not self.hasIndex(row, column, parent):
       return QtCore.QModelIndex()
     if not parent.isValid():
-      child = self.hierarchy.top_level
+      nodes = self.roots()
     else:
-      parent_module = parent.internalPointer()
-      child = parent_module.children[row]
-
-    if child:
-        return self.createIndex(row, column, child)
-    return QtCore.QModelIndex()
+      nodes = parent.internalPointer().children(self)
+    return self.createIndex(row, column, nodes[row])
   
   def parent(self, child:QtCore.QModelIndex) -> QtCore.QModelIndex:
     """Returns the parent of the model item with the given index. If the item has no parent, an invalid QModelIndex is returned."""
     if not child.isValid():
       return QtCore.QModelIndex()
-    item = child.internalPointer()
-    if not item:
+    parent = child.internalPointer().parent
+    if parent is None:
       return QtCore.QModelIndex()
-
-    parent = None
-    if parent == None:
-      return QtCore.QModelIndex()
-    else:
-      return self.createIndex(parent.row(), 0, parent)
+    return self.createIndex(parent.row, 0, parent)
 
   def rowCount(self, parent:typing.Optional[QtCore.QModelIndex]=QtCore.QModelIndex()) -> int:
     """Returns the number of rows under the given parent. When the parent is valid it means that is returning the number of children of parent."""
-    if parent.row() > 0:
+    if not parent.isValid():
+      return len(self.roots())
+    if parent.column() > 0:
       return 0
-    if parent.isValid():
-      parent_module = parent.internalPointer()
-      return len(parent_module.children)
-    else:
-      return 1 if self.hierarchy.top_level else 0
-    
+    return len(parent.internalPointer().children(self))
+
 
   def columnCount(self, parent:typing.Optional[QtCore.QModelIndex]=QtCore.QModelIndex()) -> int:
     """Returns the number of columns for the children of the given parent."""
@@ -76,7 +122,10 @@ class VerilogModuleHierarchyScopedModel(QtCore.QAbstractItemModel):
   def data(self, index:QtCore.QModelIndex, role:typing.Optional[int]=QtCore.Qt.DisplayRole) -> typing.Any:
     """Returns the data stored under the given role for the item referred to by the index."""
     if index.isValid() and role == QtCore.Qt.DisplayRole:
-      return index.internalPointer().name
+      item = index.internalPointer().item
+      if isinstance(item, ModuleConstraint):
+        return item.path
+      return item.name
     elif not index.isValid():
       return "No Data (This is a bug)"
 
@@ -91,31 +140,68 @@ class VerilogModuleHierarchyScopedModel(QtCore.QAbstractItemModel):
 
 class VerilogModuleConstraintsModel(QtCore.QAbstractItemModel):
 
-  # Internal Pointer managed as ModuleConstraint objects.
+  # Internal Pointer managed as TreeNode objects, wrapping the module's
+  # constraints and, below hierarchical ones, their master module's.
+
+  # Alignment icons, shared by all models and loaded on first use
+  _icons = None
+
+  ALIGNMENT_TOOLTIPS = {
+    IRVAlignCheck.ALIGNED: 'Grid alignment check passed.',
+    IRVAlignCheck.MISALIGNED: 'Grid alignment check failed.',
+    IRVAlignCheck.UNKNOWN: 'Grid alignment was not checked for this constraint.',
+  }
+  """
+  Tooltip header for each grid alignment check result.
+  """
 
   def __init__(self, module: 'VerilogModule'):
     super().__init__()
     self.module = module
     self.selection_model = QtCore.QItemSelectionModel(self)
     self.descend_edit = False
-    self.icon_aligned = QtGui.QIcon(str(IRVBehavior.UI_PATH / 'icon-aligned.jpg'))
-    self.icon_misaligned = QtGui.QIcon(str(IRVBehavior.UI_PATH / 'icon-misaligned.jpg'))
+    self._roots = None
 
-    for constraint in self.module.constraints_list:
-      constraint.refresh_alignment()
+    PlacementConstraintManager.refresh_alignments(self.module.constraints_list)
 
 
   ### --- Custom --- ###
 
-  def get_constraint_index(self, constraint):
-    # TODO: May need to implement `parent` for hierarchical constraints...
-    module = constraint.module
-    row = module.constraints_indices.get(constraint, 0)
+  @classmethod
+  def get_icons(cls) -> dict[IRVAlignCheck, QtGui.QIcon | None]:
+    """
+    Returns the icon for each grid alignment check result, decoding them once
+    per process.
+    """
+    if cls._icons is None:
+      cls._icons = {
+        IRVAlignCheck.ALIGNED: QtGui.QIcon(
+          str(IRVBehavior.UI_PATH / 'icon-aligned.jpg')),
+        IRVAlignCheck.MISALIGNED: QtGui.QIcon(
+          str(IRVBehavior.UI_PATH / 'icon-misaligned.jpg')),
+        IRVAlignCheck.UNKNOWN: None,
+      }
+    return cls._icons
+
+  def roots(self) -> list[TreeNode]:
+    if self._roots is None:
+      self._roots = [TreeNode(constraint, None, row) for row, constraint
+                     in enumerate(self.module.constraints_list)]
+    return self._roots
+
+  def child_items(self, constraint: ModuleConstraint) -> list[ModuleConstraint]:
+    if isinstance(constraint, ModuleHierarchical) and constraint.master_module:
+      constraints = constraint.master_module.constraints_list
+      PlacementConstraintManager.refresh_alignments(constraints)
+      return constraints
+    return []
 
-    # Get parent of constraint
-    
-
-    return self.createIndex(row, 0, constraint)
+  def get_constraint_index(self, constraint):
+    # Only this module's own constraints are selectable from its canvas
+    if constraint.module is not self.module:
+      return QtCore.QModelIndex()
+    row = constraint.row_index
+    return self.createIndex(row, 0, self.roots()[row])
   
   ### --- QAbstractItemModel --- ###
 
@@ -124,41 +210,27 @@ class VerilogModuleConstraintsModel(QtCore.QAbstractItemModel):
     if not self.hasIndex(row, column, parent):
       return QtCore.QModelIndex()
     if not parent.isValid():
-      constraint = self.module.constraints_list[row]
+      nodes = self.roots()
     else:
-      parent_constraint = parent.internalPointer()
-      constraint = parent_constraint.module.constraints_list[row]
-
-    if constraint:
-        return self.createIndex(row, column, constraint)
-    return QtCore.QModelIndex()
+      nodes = parent.internalPointer().children(self)
+    return self.createIndex(row, column, nodes[row])
   
   def parent(self, child:QtCore.QModelIndex) -> QtCore.QModelIndex:
     """Returns the parent of the model item with the given index. If the item has no parent, an invalid QModelIndex is returned."""
     if not child.isValid():
       return QtCore.QModelIndex()
-    item = child.internalPointer()
-    if not item:
+    parent = child.internalPointer().parent
+    if parent is None:
       return QtCore.QModelIndex()
-
-    parent = None
-    if parent == None:
-      return QtCore.QModelIndex()
-    else:
-      return self.createIndex(parent.row(), 0, parent)
+    return self.createIndex(parent.row, 0, parent)
 
   def rowCount(self, parent:typing.Optional[QtCore.QModelIndex]=QtCore.QModelIndex()) -> int:
     """Returns the number of rows under the given parent. When the parent is valid it means that is returning the number of children of parent."""
-    if parent.row() > 0:
+    if not parent.isValid():
+      return len(self.roots())
+    if parent.column() > 0:
       return 0
-    if parent.isValid():
-      constraint = parent.internalPointer()
-      if isinstance(constraint, ModuleHierarchical):
-        return len(constraint.module.constraints_list)
-      else:
-        return 0
-    else:
-      return len(self.module.constraints_list)
+    return len(parent.internalPointer().children(self))
     
   # def hasChildren(self, parent:typing.Optional[QtCore.QModelIndex]=QtCore.QModelIndex()) -> bool:
   #   if parent.isValid():
@@ -175,34 +247,24 @@ class VerilogModuleConstraintsModel(QtCore.QAbstractItemModel):
     if not index.isValid():
       return 'No Data (This is a bug)'
     
-    constraint: ModuleConstraint = index.internalPointer()
+    constraint: ModuleConstraint = index.internalPointer().item
     if role == QtCore.Qt.ItemDataRole.DisplayRole:
       if index.column() == 0:
         return constraint.path
       else:
         return constraint.type
     elif role == QtCore.Qt.ItemDataRole.DecorationRole and index.column() == 0:
-      if self.module.top_constraint == constraint:
+      if constraint.module.top_constraint is constraint:
         return None
-      match constraint.is_grid_aligned:
-        case IRVAlignCheck.ALIGNED:
-          return self.icon_aligned
-        case IRVAlignCheck.MISALIGNED:
-          return self.icon_misaligned
-        case IRVAlignCheck.UNKNOWN:
-          return None
+      return self.get_icons().get(constraint.is_grid_aligned)
     elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
-      header = ''
-      match constraint.is_grid_aligned:
-        case IRVAlignCheck.ALIGNED:
-          header = 'Grid alignment check passed.'
-        case IRVAlignCheck.MISALIGNED:
-          header = 'Grid alignment check failed.'
-        case IRVAlignCheck.UNKNOWN:
-          header = 'Grid alignment was not checked for this constraint.'
-      
-      # Show stackup details
-      return f'{header}\n{constraint.misaligned_log}'
+      # Qt asks on every hover, so keep the text until alignment is rechecked
+      if constraint.tooltip is None:
+        header = self.ALIGNMENT_TOOLTIPS.get(constraint.is_grid_aligned, '')
+
+        # Show stackup details
+        constraint.tooltip = f'{header}\n{constraint.misaligned_log}'
+      return constraint.tooltip
 
   def headerData(self, section:int, orientation:QtCore.Qt.Orientation, role:typing.Optional[int]=QtCore.Qt.DisplayRole) -> typing.Any:
     """Returns the data for the given role and section in the header with the specified orientation."""
@@ -1,5 +1,6 @@
 from collections import defaultdict
 import matplotlib
+import numpy as np
 
 from hammer_irview.irv.widgets.mplzoompan import ZoomPan
 
@@ -17,8 +18,20 @@ class MplCanvas(FigureCanvasQTAgg):
     self.artist_to_constraint = defaultdict(list)
     self.render_hierarchy = False
     self.needs_rerender = False
+
+    # Click targets, indexed by `build_pick_index`: rendered constraints and
+    # their (x min, y min, x max, y max) bounds, one row per constraint.
+    self.pick_constraints = []
+    self.pick_rows = {}
+    self.pick_bounds = np.empty((0, 4))
+
+    # Blitting state: background without the animated (edited) artists
+    self.background = None
+    self.animated_artists = []
+
     self.setup_mpl()
     super().__init__(self.fig)
+    self.mpl_connect('draw_event', self.handle_draw)
 
   def setup_mpl(self):
     self.fig = Figure(figsize=(1, 1), dpi=100)
@@ -50,9 +63,9 @@ class MplCanvas(FigureCanvasQTAgg):
     
   def render_module(self):
     # Render module placement constraints
+    self.stop_blitting()
+    previous_artists = list(self.artist_to_constraint)
     self.constraint_to_artists.clear()
-    for a in self.artist_to_constraint.keys():
-      a.remove()
     self.artist_to_constraint.clear()
     for constraint in self.module.constraints.values():
       artists = constraint.render(self.axes, (0, 0), under_hierarchy=False,
@@ -60,9 +73,127 @@ class MplCanvas(FigureCanvasQTAgg):
       self.constraint_to_artists[constraint] = artists
       for artist in artists:
         self.artist_to_constraint[artist] = constraint
+      # Labels are only created on resize, but must follow moved geometry
+      text_artist = constraint.text_artist
+      if text_artist is not None and text_artist.axes is self.axes:
+        constraint.draw_resize(self.axes)
+
+    # Constraints reuse their artists, so only drop those no longer rendered
+    for artist in previous_artists:
+      if artist not in self.artist_to_constraint:
+        artist.remove()
+    self.build_pick_index()
     self.needs_rerender = False
     self.draw()
 
+  def build_pick_index(self):
+    """
+    Indexes the bounds of all rendered constraints, so a click is resolved by
+    one vectorized query instead of Matplotlib testing every artist.
+    """
+    self.pick_constraints = []
+    bounds = []
+    for constraint in self.constraint_to_artists:
+      constraint_bounds = constraint.get_bounds()
+      if constraint_bounds:
+        self.pick_constraints.append(constraint)
+        bounds.append(constraint_bounds)
+    self.pick_rows = {constraint: row
+                      for row, constraint in enumerate(self.pick_constraints)}
+    self.pick_bounds = np.array(bounds, dtype=float).reshape(-1, 4)
+
+  def update_pick_bounds(self, constraint):
+    row = self.pick_rows.get(constraint)
+    bounds = constraint.get_bounds()
+    if row is None or bounds is None:
+      self.build_pick_index()
+    else:
+      self.pick_bounds[row] = bounds
+
+  def constraint_at(self, x, y):
+    """
+    Finds the constraint under a point. Where constraints overlap, the
+    smallest one wins, so nested constraints can be selected within their
+    parents.
+
+    Args:
+        x: X coordinate in data units.
+        y: Y coordinate in data units.
+
+    Returns:
+        ModuleConstraint | None: Constraint under the point, if any.
+    """
+    bounds = self.pick_bounds
+    hits = np.flatnonzero((bounds[:, 0] <= x) & (x <= bounds[:, 2])
+                          & (bounds[:, 1] <= y) & (y <= bounds[:, 3]))
+    if not hits.size:
+      return None
+    hit_bounds = bounds[hits]
+    areas = (hit_bounds[:, 2] - hit_bounds[:, 0]) \
+      * (hit_bounds[:, 3] - hit_bounds[:, 1])
+    return self.pick_constraints[hits[np.argmin(areas)]]
+
+  def handle_draw(self, event):
+    # Full draws (zoom, pan, re-render) only refresh the blit background while
+    # a constraint is being edited.
+    if not self.animated_artists:
+      return
+    self.background = self.copy_from_bbox(self.fig.bbox)
+    for artist in self.animated_artists:
+      self.axes.draw_artist(artist)
+
+  def stop_blitting(self):
+    for artist in self.animated_artists:
+      artist.set_animated(False)
+    self.animated_artists = []
+    self.background = None
+
+  def update_constraint(self, constraint):
+    """
+    Redraws a single edited constraint. The first update animates its
+    artists and does one full draw to capture a background without them;
+    further updates only restore that background and blit the artists.
+
+    Args:
+        constraint (ModuleConstraint): Constraint whose geometry changed.
+    """
+    # Only a lone rectangle can be moved in place; nested hierarchy
+    # collections have to be rebuilt at the new origin.
+    if len(self.constraint_to_artists.get(constraint, ())) != 1:
+      self.render_module()
+      return
+    artists = constraint.render_incremental(self.axes)
+    if not artists or not self.supports_blit:
+      self.render_module()
+      return
+    self.update_pick_bounds(constraint)
+
+    if self.animated_artists != artists or self.background is None:
+      self.stop_blitting()
+      for artist in artists:
+        artist.set_animated(True)
+      self.animated_artists = artists
+      self.draw()
+      return
+
+    self.restore_region(self.background)
+    for artist in artists:
+      self.axes.draw_artist(artist)
+    self.blit(self.fig.bbox)
+
+  def release(self):
+    """
+    Detaches this canvas from its module's constraints before the canvas is
+    deleted. Constraints otherwise keep their artists, and through them this
+    canvas' whole figure and render buffer, alive.
+    """
+    self.stop_blitting()
+    for constraint in self.module.constraints.values():
+      constraint.release_artists(self.axes)
+    self.constraint_to_artists.clear()
+    self.artist_to_constraint.clear()
+    self.build_pick_index()
+
   def select_constraint(self, constraint):
     # TODO: Handle selection color change
     self.selected = constraint
@@ -1,4 +1,9 @@
 
+import logging
+
+LOGGER = logging.getLogger(__name__)
+
+
 # See https://stackoverflow.com/a/19829987/5685076
 class ZoomPan:
   def __init__(self):
@@ -30,7 +35,7 @@ class ZoomPan:
       else:
         # deal with something that should never happen
         scale_factor = 1
-        print(event.button)
+        LOGGER.debug('Unexpected scroll button %s', event.button)
 
       new_width = (cur_xlim[1] - cur_xlim[0]) * scale_factor
       new_height = (cur_ylim[1] - cur_ylim[0]) * scale_factor
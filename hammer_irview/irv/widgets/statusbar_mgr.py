@@ -3,18 +3,49 @@ QStatusBar -> Logging interface
 """
 
 import logging
+import time
 
+from PySide6.QtCore import QObject, Signal
 from PySide6.QtWidgets import QStatusBar
 
 
 LOGGER = logging.getLogger(__name__)
 
-class StatusBarLogger:
+class StatusBarLogger(QObject):
+  """
+  Logs messages and forwards them to a status bar. Messages are delivered
+  through a signal, so this may be called from worker threads.
+  """
+
+  message = Signal(str)
+
+  PROGRESS_INTERVAL = 0.05
+  """
+  Minimum time in seconds between forwarded progress messages (~20 Hz).
+  """
 
   def __init__(self, statusbar: QStatusBar):
+    super().__init__()
     self.logger = LOGGER
     self.statusbar = statusbar
+    self.last_progress = 0.0
+    self.message.connect(self.statusbar.showMessage)
 
   def showMessage(self, msg: str):
     self.logger.info(msg)
-    self.statusbar.showMessage(msg)
\ No newline at end of file
+    self.message.emit(msg)
+
+  def showProgress(self, msg: str):
+    """
+    Forwards a per-item progress message, dropping those that arrive faster
+    than the status bar could usefully repaint. Follow a progress loop with
+    `showMessage` so the final state is always shown.
+
+    Args:
+        msg (str): Progress message.
+    """
+    self.logger.debug(msg)
+    now = time.monotonic()
+    if now - self.last_progress >= self.PROGRESS_INTERVAL:
+      self.last_progress = now
+      self.message.emit(msg)